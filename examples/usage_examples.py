@@ -7,8 +7,8 @@ import asyncio
 import sys
 from pathlib import Path
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Make the repository root importable so `src.*` resolves without installing
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import logging
 
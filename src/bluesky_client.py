@@ -2,6 +2,7 @@
 Bluesky client wrapper for Social Sync
 """
 
+import functools
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -85,9 +86,13 @@ class BlueskyClient:
     def __init__(self, handle: str, password: str):
         self.handle = handle
         self.password = password
-        self.client = AtprotoClient()
         self._authenticated = False
 
+    @functools.cached_property
+    def client(self) -> AtprotoClient:
+        """Underlying AT Protocol client, created on first use"""
+        return AtprotoClient()
+
     def authenticate(self) -> bool:
         """Authenticate with Bluesky"""
         try:
@@ -310,13 +315,13 @@ class BlueskyClient:
                     and post.record.labels.values
                 ):
                     self_labels = [label.val for label in post.record.labels.values]
-                    logger.debug(f"Found self-labels: {self_labels}")
+                    logger.debug("Found self-labels: %s", self_labels)
 
                 # Extract language tags if present
                 langs = None
                 if hasattr(post.record, "langs") and post.record.langs:
                     langs = list(post.record.langs)
-                    logger.debug(f"Found language tags: {langs}")
+                    logger.debug("Found language tags: %s", langs)
 
                 bluesky_post = BlueskyPost(
                     uri=post.uri,
@@ -4,9 +4,9 @@ Configuration management for Social Sync
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -16,6 +16,15 @@ class ConfigurationError(Exception):
     pass
 
 
+def _parse_sync_start_date(value: str) -> datetime:
+    """Parse a SYNC_START_DATE value; date-only values start at midnight UTC"""
+    if "T" in value:
+        # Full datetime format
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # Date only format - start at beginning of day UTC
+    return datetime.fromisoformat(f"{value}T00:00:00+00:00")
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
 
@@ -74,6 +83,9 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env", "case_sensitive": False, "extra": "ignore"}
 
+    # sync_start_date and its parsed datetime, filled on first use
+    _sync_start_cache: Optional[Tuple[str, datetime]] = PrivateAttr(default=None)
+
     @field_validator("image_upload_failure_strategy")
     @classmethod
     def validate_image_upload_failure_strategy(cls, v):
@@ -111,13 +123,7 @@ class Settings(BaseSettings):
         if v is None:
             return v
         try:
-            # Try to parse the date string
-            if "T" in v:
-                # Full datetime format
-                datetime.fromisoformat(v.replace("Z", "+00:00"))
-            else:
-                # Date only format - add time
-                datetime.fromisoformat(f"{v}T00:00:00+00:00")
+            _parse_sync_start_date(v)
             return v
         except ValueError:
             raise ValueError(
@@ -125,21 +131,22 @@ class Settings(BaseSettings):
             )
 
     def get_sync_start_datetime(self) -> datetime:
-        """Get the sync start date as a datetime object"""
+        """Get the sync start date as a datetime object
+
+        The configured date is parsed once and reused while sync_start_date is
+        unchanged. The 7-days-ago default depends on the clock, so it is never cached.
+        """
         if self.sync_start_date:
+            cached = self._sync_start_cache
+            if cached is not None and cached[0] == self.sync_start_date:
+                return cached[1]
             try:
-                if "T" in self.sync_start_date:
-                    # Full datetime format
-                    return datetime.fromisoformat(
-                        self.sync_start_date.replace("Z", "+00:00")
-                    )
-                else:
-                    # Date only format - start at beginning of day UTC
-                    return datetime.fromisoformat(
-                        f"{self.sync_start_date}T00:00:00+00:00"
-                    )
+                parsed = _parse_sync_start_date(self.sync_start_date)
             except ValueError:
                 pass
+            else:
+                self._sync_start_cache = (self.sync_start_date, parsed)
+                return parsed
 
         # Default: 7 days ago
         from datetime import timedelta
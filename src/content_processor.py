@@ -21,7 +21,10 @@ class ContentProcessor:
     MENTION_PATTERN = re.compile(r"@([a-zA-Z0-9][a-zA-Z0-9.-]*\.?[a-zA-Z]{2,})")
     URL_PATTERN = re.compile(r"https?://[^\s]+")
     # Note: HASHTAG extraction uses custom logic in extract_hashtags() method
-    # due to complex edge cases that can't be handled by a single regex
+    # due to complex edge cases that can't be handled by a single regex.
+    # The candidate patterns are compiled once here rather than on every call.
+    HASHTAG_PATTERN = re.compile(r"#([^\s#]+)")
+    DOUBLE_HASH_PATTERN = re.compile(r"##[^\s#]+")
 
     # Mapping of Bluesky self-labels to Mastodon content warnings
     CONTENT_WARNING_LABELS = {
@@ -141,8 +144,9 @@ class ContentProcessor:
         if not facets:
             return text
 
-        # Convert text to bytes for accurate indexing
-        text_bytes = text.encode("utf-8")
+        # Convert text to a mutable byte buffer for accurate indexing; URLs are
+        # spliced in place instead of rebuilding the whole byte string per facet
+        text_bytes = bytearray(text.encode("utf-8"))
 
         # Process facets in reverse order to avoid index shifting when replacing text
         sorted_facets = sorted(
@@ -175,12 +179,10 @@ class ContentProcessor:
                         if full_url:
                             # Replace at byte positions
                             if byte_end <= len(text_bytes):
-                                text_bytes = (
-                                    text_bytes[:byte_start]
-                                    + full_url.encode("utf-8")
-                                    + text_bytes[byte_end:]
+                                text_bytes[byte_start:byte_end] = full_url.encode(
+                                    "utf-8"
                                 )
-                                logger.debug(f"Expanded URL from facets: {full_url}")
+                                logger.debug("Expanded URL from facets: %s", full_url)
                             break
 
             except Exception as e:
@@ -216,7 +218,7 @@ class ContentProcessor:
                     return text + link_text
                 else:
                     # URL already in text (likely from facets), don't add again
-                    logger.debug(f"Skipping duplicate external link: {external_uri}")
+                    logger.debug("Skipping duplicate external link: %s", external_uri)
                     return text
 
         elif embed_type == "images":
@@ -300,21 +302,17 @@ class ContentProcessor:
         # Strategy: find all hashtag-like patterns, then filter based on context
         hashtags = []
 
-        # Use the original simple pattern
-        original_pattern = re.compile(r"#([^\s#]+)")
-
         # First, find all hashtag positions that should be excluded
         excluded_positions = set()
 
         # Exclude hashtags that start with ##
-        double_hash_pattern = re.compile(r"##[^\s#]+")
-        for match in double_hash_pattern.finditer(text):
+        for match in ContentProcessor.DOUBLE_HASH_PATTERN.finditer(text):
             # Mark both # positions as excluded
             excluded_positions.add(match.start())
             excluded_positions.add(match.start() + 1)
 
         # Now find valid hashtags
-        for match in original_pattern.finditer(text):
+        for match in ContentProcessor.HASHTAG_PATTERN.finditer(text):
             start_pos = match.start()
             hashtag_content = match.group(1)
 
@@ -3,9 +3,11 @@ Main sync orchestrator for Social Sync
 """
 
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .bluesky_client import BlueskyClient, BlueskyFetchResult, BlueskyPost
 from .config import get_settings
@@ -25,6 +27,10 @@ class SocialSyncOrchestrator:
         self.mastodon_client = None
         self.sync_state = SyncState(self.settings.state_file)
         self.content_processor = ContentProcessor()
+        # Media may be uploaded on a background worker (see run_sync); Mastodon.py
+        # shares one requests.Session and its rate-limit state across calls
+        # without locking, so serialize access
+        self._mastodon_lock = threading.Lock()
 
     def setup_clients(self) -> bool:
         """Initialize and authenticate clients"""
@@ -154,8 +160,19 @@ class SocialSyncOrchestrator:
         logger.info(f"Found {len(new_posts)} new posts to sync")
         return new_posts, skipped_with_tag_count
 
-    def sync_post(self, bluesky_post: BlueskyPost) -> bool:
-        """Sync a single post from Bluesky to Mastodon"""
+    def sync_post(
+        self,
+        bluesky_post: BlueskyPost,
+        prepared_media: Optional[Union[Tuple[List[str], bool, int], Exception]] = None,
+    ) -> bool:
+        """Sync a single post from Bluesky to Mastodon
+
+        Args:
+            bluesky_post: The post to sync
+            prepared_media: Result of ``_upload_media`` computed ahead of time (see
+                ``run_sync``), or the exception it raised. When omitted, media is
+                uploaded inline.
+        """
         try:
             logger.info(f"Syncing post: {bluesky_post.uri}")
 
@@ -210,16 +227,15 @@ class SocialSyncOrchestrator:
             all_images_successful = True
             successful_image_count = 0
             if bluesky_post.embed and not self.settings.dry_run:
-                # Sync images with failure tracking
-                image_media_ids, all_images_successful = self._sync_images(bluesky_post)
-                media_ids.extend(image_media_ids)
-                successful_image_count = len(image_media_ids)
-
-                # Sync videos if enabled
-                if self.settings.sync_videos:
-                    video_id = self._sync_video(bluesky_post)
-                    if video_id:
-                        media_ids.append(video_id)
+                if prepared_media is None:
+                    prepared_media = self._upload_media(bluesky_post)
+                elif isinstance(prepared_media, Exception):
+                    # Fail the post exactly as an inline upload error would
+                    raise prepared_media
+                uploaded_ids, all_images_successful, successful_image_count = (
+                    prepared_media
+                )
+                media_ids.extend(uploaded_ids)
 
             # Handle image upload failures based on strategy
             if not all_images_successful and not self.settings.dry_run:
@@ -268,7 +284,7 @@ class SocialSyncOrchestrator:
             language = None
             if bluesky_post.langs and len(bluesky_post.langs) > 0:
                 language = bluesky_post.langs[0]
-                logger.debug(f"Using language tag: {language}")
+                logger.debug("Using language tag: %s", language)
 
             if self.settings.dry_run:
                 # Show what would be synced
@@ -293,14 +309,15 @@ class SocialSyncOrchestrator:
                 return True
             else:
                 # Post to Mastodon with media attachments, reply info, content warnings, and language
-                mastodon_response = self.mastodon_client.post_status(
-                    processed_text,
-                    in_reply_to_id=in_reply_to_id,
-                    media_ids=media_ids if media_ids else None,
-                    sensitive=is_sensitive,
-                    spoiler_text=spoiler_text,
-                    language=language,
-                )
+                with self._mastodon_lock:
+                    mastodon_response = self.mastodon_client.post_status(
+                        processed_text,
+                        in_reply_to_id=in_reply_to_id,
+                        media_ids=media_ids if media_ids else None,
+                        sensitive=is_sensitive,
+                        spoiler_text=spoiler_text,
+                        language=language,
+                    )
                 if not mastodon_response:
                     logger.error(f"Failed to post to Mastodon: {bluesky_post.uri}")
                     return False
@@ -339,6 +356,50 @@ class SocialSyncOrchestrator:
             return bluesky_post.uri.split("/")[2]
         return bluesky_post.author_handle
 
+    def _upload_media(self, bluesky_post: BlueskyPost) -> Tuple[List[str], bool, int]:
+        """Upload a post's images (and video, if enabled) to Mastodon
+
+        Returns:
+            tuple: (media_ids, all_images_successful, successful_image_count)
+        """
+        media_ids: List[str] = []
+
+        # Sync images with failure tracking
+        image_media_ids, all_images_successful = self._sync_images(bluesky_post)
+        media_ids.extend(image_media_ids)
+
+        # Sync videos if enabled
+        if self.settings.sync_videos:
+            video_id = self._sync_video(bluesky_post)
+            if video_id:
+                media_ids.append(video_id)
+
+        return (media_ids, all_images_successful, len(image_media_ids))
+
+    def _prefetch_media(
+        self, executor: ThreadPoolExecutor, bluesky_post: BlueskyPost
+    ) -> Optional["Future[Tuple[List[str], bool, int]]"]:
+        """Start uploading a post's media in the background, if it has any"""
+        if not bluesky_post.embed or self.settings.dry_run:
+            return None
+        return executor.submit(self._upload_media, bluesky_post)
+
+    def _collect_prefetched_media(
+        self, future: Optional["Future[Tuple[List[str], bool, int]]"]
+    ) -> Optional[Union[Tuple[List[str], bool, int], Exception]]:
+        """Wait for a background media upload; None means nothing was prefetched
+
+        A failed upload is returned as its exception rather than retried inline:
+        part of it may already have reached Mastodon, and a retry could upload the
+        same media twice. ``sync_post`` then fails the post so the next run retries.
+        """
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            return e
+
     def _sync_images(self, bluesky_post: BlueskyPost) -> Tuple[List[str], bool]:
         """Download images from Bluesky and upload to Mastodon
 
@@ -444,11 +505,12 @@ class SocialSyncOrchestrator:
                 mime_type = actual_mime_type or mime_type
 
                 # Upload to Mastodon
-                media_id: Optional[str] = self.mastodon_client.upload_media(
-                    media_file=image_bytes,
-                    mime_type=mime_type,
-                    description=image_info.get("alt", ""),
-                )
+                with self._mastodon_lock:
+                    media_id: Optional[str] = self.mastodon_client.upload_media(
+                        media_file=image_bytes,
+                        mime_type=mime_type,
+                        description=image_info.get("alt", ""),
+                    )
 
                 if media_id:
                     logger.info(
@@ -517,9 +579,10 @@ class SocialSyncOrchestrator:
         video_bytes, mime_type = video_data
 
         # Upload to Mastodon
-        media_id: Optional[str] = self.mastodon_client.upload_video(
-            video_bytes, mime_type=mime_type, description=alt_text
-        )
+        with self._mastodon_lock:
+            media_id: Optional[str] = self.mastodon_client.upload_video(
+                video_bytes, mime_type=mime_type, description=alt_text
+            )
 
         if media_id:
             logger.info(f"Successfully synced video: {media_id}")
@@ -559,15 +622,32 @@ class SocialSyncOrchestrator:
         synced_count = 0
         failed_count = 0
 
-        for post in posts_to_sync:
-            if self.sync_post(post):
-                synced_count += 1
-                # Add delay between posts to avoid rate limiting
-                if synced_count < len(posts_to_sync):  # Don't delay after the last post
-                    logger.info("Waiting 1 second to avoid rate limiting...")
-                    time.sleep(1)
-            else:
-                failed_count += 1
+        # Statuses are posted strictly in order (replies depend on their parents'
+        # Mastodon IDs). The next post's media is uploaded on a background worker
+        # during the rate-limit pause, and only once the current post is done, so
+        # nothing is uploaded for a post the loop never gets to.
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="media-upload"
+        ) as media_executor:
+            pending_media = None
+
+            for index, post in enumerate(posts_to_sync):
+                prepared_media = self._collect_prefetched_media(pending_media)
+                pending_media = None
+
+                if self.sync_post(post, prepared_media=prepared_media):
+                    synced_count += 1
+                    # Add delay between posts to avoid rate limiting
+                    # (but don't delay after the last post)
+                    if synced_count < len(posts_to_sync):
+                        if index + 1 < len(posts_to_sync):
+                            pending_media = self._prefetch_media(
+                                media_executor, posts_to_sync[index + 1]
+                            )
+                        logger.info("Waiting 1 second to avoid rate limiting...")
+                        time.sleep(1)
+                else:
+                    failed_count += 1
 
         # Update sync state only if posts were synced or skipped
         # This prevents unnecessary commits when nothing changed
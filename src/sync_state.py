@@ -58,9 +58,12 @@ class SyncState:
     def _save_state(self):
         """Save state to file"""
         try:
+            # Encode up front: a single write is cheaper than json.dump's many small
+            # chunked writes, and an encoding error can't leave a truncated file.
+            serialized = json.dumps(self.state, indent=2, default=str)
             with open(self.state_file, "w") as f:
-                json.dump(self.state, f, indent=2, default=str)
-            logger.debug(f"State saved to {self.state_file}")
+                f.write(serialized)
+            logger.debug("State saved to %s", self.state_file)
         except Exception as e:
             logger.error(f"Failed to save state file: {e}")
 
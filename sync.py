@@ -9,18 +9,27 @@ import subprocess  # nosec B404
 import sys
 import warnings
 from pathlib import Path
-
-# Suppress urllib3 OpenSSL warning on macOS (LibreSSL is functionally equivalent)
-warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL 1.1.1+")
+from typing import TYPE_CHECKING, Any
+
+# Suppress urllib3 OpenSSL warning on macOS (LibreSSL is functionally equivalent).
+# Only register the filter once: re-registering on every re-import would reset the
+# warning registries of all modules for no benefit.
+_URLLIB3_SSL_WARNING = "urllib3 v2 only supports OpenSSL 1.1.1+"
+if not any(
+    action == "ignore"
+    and message is not None
+    and message.pattern == _URLLIB3_SSL_WARNING
+    for action, message, *_ in warnings.filters
+):
+    warnings.filterwarnings("ignore", message=_URLLIB3_SSL_WARNING)
 
 import click
 from dotenv import load_dotenv
 
-# Add src to Python path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from src.config import ConfigurationError, get_settings  # noqa: E402
-from src.sync_orchestrator import SocialSyncOrchestrator  # noqa: E402
+
+if TYPE_CHECKING:
+    from src.sync_orchestrator import SocialSyncOrchestrator
 
 try:
     from src.social_sync import __version__
@@ -74,8 +83,33 @@ def _cli_name() -> str:
     return "python sync.py"
 
 
-# Load environment variables
-load_dotenv()
+def __getattr__(name: str) -> Any:
+    """Lazily resolve the orchestrator (PEP 562).
+
+    Importing ``src.sync_orchestrator`` pulls in atproto and mastodon.py, so it is
+    deferred until a command actually needs it and ``--help`` stays fast.
+    """
+    if name == "SocialSyncOrchestrator":
+        from src.sync_orchestrator import SocialSyncOrchestrator
+
+        return SocialSyncOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _create_orchestrator() -> "SocialSyncOrchestrator":
+    """Instantiate the orchestrator, importing it on first use."""
+    orchestrator_cls: "type[SocialSyncOrchestrator]" = getattr(
+        sys.modules[__name__], "SocialSyncOrchestrator"
+    )
+    return orchestrator_cls()
+
+
+# Load environment variables once. importlib.reload() re-runs this module in the
+# same namespace, so a module-level flag survives re-imports without leaking into
+# the environment of child processes.
+if not globals().get("_dotenv_loaded", False):
+    load_dotenv()
+    _dotenv_loaded = True
 
 
 def setup_logging(log_level: str):
@@ -129,21 +163,25 @@ def sync(dry_run, since_date, disable_source_platform):
         os.environ["DISABLE_SOURCE_PLATFORM"] = "true"
 
     try:
-        orchestrator = SocialSyncOrchestrator()
+        orchestrator = _create_orchestrator()
         result = orchestrator.run_sync()
 
         if result["success"]:
-            click.echo("✅ Sync completed successfully!")
-            click.echo(f"   • Synced: {result['synced_count']} posts")
+            # Build the report first and write it in one go
+            lines = [
+                "✅ Sync completed successfully!",
+                f"   • Synced: {result['synced_count']} posts",
+            ]
             if result["failed_count"] > 0:
-                click.echo(f"   • Failed: {result['failed_count']} posts")
+                lines.append(f"   • Failed: {result['failed_count']} posts")
             if result.get("skipped_count", 0) > 0:
-                click.echo(
+                lines.append(
                     f"   • Skipped: {result['skipped_count']} posts (with #no-sync tag)"
                 )
-            click.echo(f"   • Duration: {result['duration']:.2f}s")
+            lines.append(f"   • Duration: {result['duration']:.2f}s")
             if result["dry_run"]:
-                click.echo("   • Mode: DRY RUN (no posts actually created)")
+                lines.append("   • Mode: DRY RUN (no posts actually created)")
+            click.echo("\n".join(lines))
         else:
             click.echo(f"❌ Sync failed: {result.get('error', 'Unknown error')}")
             sys.exit(1)
@@ -161,15 +199,16 @@ def sync(dry_run, since_date, disable_source_platform):
 def status():
     """Show sync status"""
     try:
-        orchestrator = SocialSyncOrchestrator()
+        orchestrator = _create_orchestrator()
         status_info = orchestrator.get_sync_status()
 
-        click.echo("📊 Social Sync Status")
-        click.echo(f"   • Last sync: {status_info['last_sync_time'] or 'Never'}")
-        click.echo(f"   • Total synced posts: {status_info['total_synced_posts']}")
-        click.echo(
-            f"   • Dry run mode: {'ON' if status_info['dry_run_mode'] else 'OFF'}"
-        )
+        lines = [
+            "📊 Social Sync Status",
+            f"   • Last sync: {status_info['last_sync_time'] or 'Never'}",
+            f"   • Total synced posts: {status_info['total_synced_posts']}",
+            f"   • Dry run mode: {'ON' if status_info['dry_run_mode'] else 'OFF'}",
+        ]
+        click.echo("\n".join(lines))
 
     except ConfigurationError as e:
         click.echo(f"❌ {e}", err=True)
@@ -186,23 +225,28 @@ def config():
     try:
         settings = get_settings()
 
-        click.echo("⚙️ Social Sync Configuration")
-        click.echo(f"   • Bluesky handle: {settings.bluesky_handle}")
-        click.echo(f"   • Mastodon instance: {settings.mastodon_api_base_url}")
-        click.echo(f"   • Sync interval: {settings.sync_interval_minutes} minutes")
-        click.echo(f"   • Max posts per sync: {settings.max_posts_per_sync}")
+        lines = [
+            "⚙️ Social Sync Configuration",
+            f"   • Bluesky handle: {settings.bluesky_handle}",
+            f"   • Mastodon instance: {settings.mastodon_api_base_url}",
+            f"   • Sync interval: {settings.sync_interval_minutes} minutes",
+            f"   • Max posts per sync: {settings.max_posts_per_sync}",
+        ]
 
         # Show sync start date (either configured or default)
         sync_start = settings.get_sync_start_datetime()
         if settings.sync_start_date:
-            click.echo(f"   • Sync start date: {settings.sync_start_date} (configured)")
+            lines.append(
+                f"   • Sync start date: {settings.sync_start_date} (configured)"
+            )
         else:
-            click.echo(
+            lines.append(
                 f"   • Sync start date: {sync_start.strftime('%Y-%m-%d')} (default: 7 days ago)"
             )
 
-        click.echo(f"   • Dry run: {settings.dry_run}")
-        click.echo(f"   • Log level: {settings.log_level}")
+        lines.append(f"   • Dry run: {settings.dry_run}")
+        lines.append(f"   • Log level: {settings.log_level}")
+        click.echo("\n".join(lines))
 
     except ConfigurationError as e:
         click.echo(f"❌ {e}", err=True)
@@ -260,7 +304,14 @@ def setup():
             if editor_cmd in safe_editors:
                 click.echo(f"Opening .env with {editor}...")
                 try:
-                    subprocess.run([editor_cmd, ".env"], check=True)  # nosec B603
+                    if sys.platform == "win32":
+                        # Windows has no real exec: os.execvp spawns the editor and
+                        # exits this process, so wait on a child instead.
+                        subprocess.run([editor_cmd, ".env"], check=True)  # nosec B603
+                    else:
+                        # Nothing runs after the editor, so hand the process over
+                        # to it instead of forking a child and waiting on it.
+                        os.execvp(editor_cmd, [editor_cmd, ".env"])  # nosec B606
                 except subprocess.CalledProcessError:
                     click.echo(
                         f"⚠️  Could not open {editor_cmd}. Please edit .env manually."
@@ -283,7 +334,7 @@ def setup():
 def test():
     """Test client connections without syncing"""
     try:
-        orchestrator = SocialSyncOrchestrator()
+        orchestrator = _create_orchestrator()
 
         click.echo("🔧 Testing client connections...")
 
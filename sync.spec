@@ -11,8 +11,10 @@ a = Analysis(
     datas=[
         # Bundle .env.example so users can reference it for setup
         (".env.example", "."),
-        # Bundle the src package so all modules are available
-        ("src", "src"),
+        # The src package is NOT bundled as data: every src module is listed in
+        # hiddenimports below, so it already ships as precompiled bytecode inside the
+        # PYZ archive. Copying the raw source tree as well only made the onefile
+        # bootloader extract it to a temp dir on every launch.
     ],
     hiddenimports=[
         # Core src modules
@@ -0,0 +1,104 @@
+"""
+Shared pytest fixtures for Social Sync tests
+"""
+
+import os
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import Mock
+
+import pytest
+
+# Environment variable prefixes cleared before each test, so settings from the
+# developer's shell cannot leak into assertions about defaults and parsing
+_SOCIAL_SYNC_ENV_PREFIXES = (
+    "BLUESKY_",
+    "MASTODON_",
+    "SYNC_",
+    "MAX_POSTS",
+    "DRY_RUN",
+    "LOG_LEVEL",
+    "DISABLE_SOURCE_PLATFORM",
+    "MAX_VIDEO_SIZE_MB",
+    "IMAGE_UPLOAD_",
+    "STATE_FILE",
+)
+
+
+@pytest.fixture
+def clean_settings_env(monkeypatch):
+    """Clear social sync env vars; monkeypatch restores only what each test touches"""
+    for key in list(os.environ):
+        if key.upper().startswith(_SOCIAL_SYNC_ENV_PREFIXES):
+            monkeypatch.delenv(key)
+
+
+@pytest.fixture
+def settings_credentials(clean_settings_env, monkeypatch):
+    """Valid-looking credentials, so Settings() validates without a .env file"""
+    monkeypatch.setenv("BLUESKY_HANDLE", "test.bsky.social")
+    monkeypatch.setenv("BLUESKY_PASSWORD", "test-password")
+    monkeypatch.setenv("MASTODON_ACCESS_TOKEN", "test-token")
+
+
+@pytest.fixture(scope="session")
+def _atproto_client_spec() -> List[str]:
+    """Attribute names of the AT Protocol client, introspected once per session"""
+    from atproto import Client as AtprotoClient
+
+    # `me` is only assigned on the instance after login, so dir() on the class misses it
+    return sorted(set(dir(AtprotoClient)) | {"me"})
+
+
+@pytest.fixture
+def atproto_mock(_atproto_client_spec: List[str]) -> Mock:
+    """Fresh AT Protocol client double limited to the real client's attributes"""
+    return Mock(spec=_atproto_client_spec)
+
+
+@pytest.fixture
+def bluesky_client(monkeypatch, atproto_mock):
+    """BlueskyClient for the default test account, backed by ``atproto_mock``"""
+    from src.bluesky_client import BlueskyClient
+
+    monkeypatch.setattr(
+        "src.bluesky_client.AtprotoClient", lambda *a, **kw: atproto_mock
+    )
+    return BlueskyClient("test.bsky.social", "test-password")
+
+
+@pytest.fixture
+def make_feed_item():
+    """Factory for author-feed items shaped like the AT Protocol FeedViewPost"""
+
+    def _make(
+        text="Test post content",
+        created_at="2025-01-01T10:00:00.000Z",
+        reply=None,
+        embed=None,
+        labels=None,
+        langs=None,
+        uri="at://did:plc:test123/app.bsky.feed.post/12345",
+        cid="test-cid",
+        author=None,
+    ):
+        record = SimpleNamespace(
+            text=text,
+            created_at=created_at,
+            facets=[],
+            embed=embed,
+            reply=reply,
+            labels=labels,
+            langs=langs,
+        )
+        if author is None:
+            author = SimpleNamespace(
+                handle="test.bsky.social", display_name="Test User"
+            )
+        # `reason` is only set for reposts; original posts carry None like the real model
+        return SimpleNamespace(
+            post=SimpleNamespace(uri=uri, cid=cid, record=record, author=author),
+            reason=None,
+        )
+
+    return _make
@@ -3,1438 +3,877 @@ Tests for Bluesky Client
 """
 
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call
 
-from src.bluesky_client import BlueskyClient, BlueskyFetchResult, BlueskyPost
+import pytest
+from atproto import models
 
+from src.bluesky_client import BlueskyClient, BlueskyFetchResult, BlueskyPost
 
-class TestBlueskyClient:
-    """Test suite for BlueskyClient class"""
-
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.client = BlueskyClient("test.bsky.social", "test-password")
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_init(self, mock_client_class):
-        """Test client initialization"""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-
-        assert client.handle == "test.bsky.social"
-        assert client.password == "test-password"
-        assert client.client == mock_client
-        assert client._authenticated is False
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_authenticate_success(self, mock_client_class):
-        """Test successful authentication"""
-        mock_client = Mock()
-        mock_profile = Mock()
-        mock_profile.handle = "test.bsky.social"
-        mock_profile.display_name = "Test User"
-        mock_client.login.return_value = mock_profile
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        result = client.authenticate()
-
-        assert result is True
-        assert client._authenticated is True
-        mock_client.login.assert_called_once_with("test.bsky.social", "test-password")
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_authenticate_failure(self, mock_client_class):
-        """Test authentication failure"""
-        mock_client = Mock()
-        mock_client.login.side_effect = Exception("Authentication failed")
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "invalid-password")
-        result = client.authenticate()
-
-        assert result is False
-        assert client._authenticated is False
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_user_did_authenticated(self, mock_client_class):
-        """Test getting user DID when authenticated"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        result = client.get_user_did()
-        assert result == "did:plc:test123"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_user_did_not_authenticated(self, mock_client_class):
-        """Test getting user DID when not authenticated"""
-        mock_client = Mock()
-        # Make authentication fail
-        mock_client.login.side_effect = Exception("Not authenticated")
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        # Client starts as not authenticated
-
-        result = client.get_user_did()
-        assert result is None
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_empty(self, mock_client_class):
-        """Test getting recent posts when no posts exist"""
-        mock_client = Mock()
-
-        # Mock empty feed response
-        mock_response = Mock()
-        mock_response.feed = []
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        result = client.get_recent_posts()
-
-        assert result.posts == []
-        assert result.total_retrieved == 0
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-        assert result.filtered_quotes == 0
-        mock_client.get_author_feed.assert_called_once()
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_posts(self, mock_client_class):
-        """Test getting recent posts with actual posts"""
-        mock_client = Mock()
-
-        # Mock feed response with posts
-        mock_post_record = Mock()
-        mock_post_record.text = "Test post content"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        # Ensure no 'reason' attribute (no repost)
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        assert result.total_retrieved == 1
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-
-        post = result.posts[0]
-        assert isinstance(post, BlueskyPost)
-        assert post.uri == "at://did:plc:test123/app.bsky.feed.post/12345"
-        assert post.text == "Test post content"
-        assert post.author_handle == "test.bsky.social"
-        assert post.author_display_name == "Test User"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_reply(self, mock_client_class):
-        """Test that reply posts to others' posts are filtered out"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock reply post record - reply to someone else's post
-        mock_reply = Mock()
-        mock_reply.root = Mock()
-        # Root belongs to someone else
-        mock_reply.root.uri = "at://did:plc:otheruser456/app.bsky.feed.post/their-post"
-        mock_reply.parent = Mock()
-        mock_reply.parent.uri = (
-            "at://did:plc:otheruser456/app.bsky.feed.post/their-post"
+_TEST_HANDLE = "test.bsky.social"
+_TEST_DID = "did:plc:test123"
+_OTHER_DID = "did:plc:otheruser456"
+
+
+def _post_uri(slug, did=_TEST_DID):
+    """AT Protocol URI of a post by the given account"""
+    return f"at://{did}/app.bsky.feed.post/{slug}"
+
+
+# Read-only doubles shared by tests; the client never mutates them
+_EMPTY_FEED_RESPONSE = SimpleNamespace(feed=[])
+_USER_A_AUTHOR = SimpleNamespace(handle="userA.bsky.social", display_name="User A")
+
+# Link-card embed as a raw dict rather than a model instance
+_EXTERNAL_EMBED_DICT = {
+    "$type": "app.bsky.embed.external",
+    "external": {
+        "uri": "https://example.com",
+        "title": "Example Site",
+        "description": "Test description",
+    },
+}
+# The same link card as an AT Protocol model; only `external` is set, so no
+# images/media/record branches are taken
+_EXTERNAL_EMBED = SimpleNamespace(
+    py_type="app.bsky.embed.external",
+    external=SimpleNamespace(
+        uri="https://example.com",
+        title="Example",
+        description="Test description",
+    ),
+)
+# Attribute bags that look like AT Protocol link facet objects
+_LINK_FACETS = [
+    SimpleNamespace(
+        index=SimpleNamespace(byte_start=0, byte_end=10),
+        features=[SimpleNamespace(uri="https://example.com")],
+    )
+]
+
+# Post timestamps on either side of the since_date cut-off used in date filtering
+_SINCE_DATE_REF = datetime(2024, 12, 31, tzinfo=timezone.utc)
+_POST_DATE_OLD = "2024-12-01T10:00:00.000Z"
+_POST_DATE_NEW = "2025-01-01T10:00:00.000Z"
+
+# What get_recent_posts reports when the author feed cannot be fetched
+_EMPTY_FETCH_RESULT = BlueskyFetchResult(
+    posts=[],
+    total_retrieved=0,
+    filtered_replies=0,
+    filtered_reposts=0,
+    filtered_by_date=0,
+)
+
+
+def _reply_ref(root_uri, parent_uri):
+    """Reply reference pointing at the given thread root and parent posts"""
+    return SimpleNamespace(
+        root=SimpleNamespace(uri=root_uri), parent=SimpleNamespace(uri=parent_uri)
+    )
+
+
+def test_make_feed_item_matches_atproto_models(make_feed_item):
+    """Test the feed-item doubles only use fields the real AT Protocol models define"""
+    item = make_feed_item(
+        reply=_reply_ref(_post_uri("root"), _post_uri("parent")),
+        labels=SimpleNamespace(values=[SimpleNamespace(val="porn")]),
+    )
+
+    for double, model in [
+        (item, models.AppBskyFeedDefs.FeedViewPost),
+        (item.post, models.AppBskyFeedDefs.PostView),
+        (item.post.author, models.AppBskyActorDefs.ProfileViewBasic),
+        (item.post.record, models.AppBskyFeedPost.Record),
+        (item.post.record.reply, models.AppBskyFeedPost.ReplyRef),
+        (item.post.record.reply.root, models.ComAtprotoRepoStrongRef.Main),
+        (item.post.record.labels, models.ComAtprotoLabelDefs.SelfLabels),
+        (item.post.record.labels.values[0], models.ComAtprotoLabelDefs.SelfLabel),
+    ]:
+        assert set(vars(double)) <= set(model.model_fields), model.__name__
+
+
+def test_init(bluesky_client, atproto_mock):
+    """Test client initialization"""
+    assert bluesky_client.handle == _TEST_HANDLE
+    assert bluesky_client.password == "test-password"
+    assert bluesky_client.client == atproto_mock
+    assert bluesky_client._authenticated is False
+
+
+def test_atproto_client_created_on_first_use(monkeypatch, atproto_mock):
+    """Test the AT Protocol client is only constructed when first accessed"""
+    atproto_factory = Mock(return_value=atproto_mock)
+    monkeypatch.setattr("src.bluesky_client.AtprotoClient", atproto_factory)
+
+    client = BlueskyClient(_TEST_HANDLE, "test-password")
+    atproto_factory.assert_not_called()
+
+    assert client.client is atproto_mock
+    assert client.client is atproto_mock
+    atproto_factory.assert_called_once_with()
+
+
+def test_authenticate_success(bluesky_client, atproto_mock):
+    """Test successful authentication"""
+    atproto_mock.login.return_value = SimpleNamespace(
+        handle=_TEST_HANDLE, display_name="Test User"
+    )
+
+    result = bluesky_client.authenticate()
+
+    assert result is True
+    assert bluesky_client._authenticated is True
+    assert atproto_mock.login.call_count == 1
+    assert atproto_mock.login.call_args == call(_TEST_HANDLE, "test-password")
+
+
+def test_get_user_did_authenticated(bluesky_client, atproto_mock):
+    """Test getting user DID when authenticated"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
+
+    bluesky_client._authenticated = True  # Set authenticated directly for this test
+
+    result = bluesky_client.get_user_did()
+    assert result == _TEST_DID
+
+
+def test_get_user_did_not_authenticated(bluesky_client, atproto_mock):
+    """Test getting user DID when not authenticated"""
+    # Make authentication fail
+    atproto_mock.login.side_effect = Exception("Not authenticated")
+    # Client starts as not authenticated
+
+    result = bluesky_client.get_user_did()
+    assert result is None
+
+
+def test_get_recent_posts_empty(bluesky_client, atproto_mock):
+    """Test getting recent posts when no posts exist"""
+    # Mock empty feed response
+    atproto_mock.get_author_feed.return_value = _EMPTY_FEED_RESPONSE
+
+    bluesky_client._authenticated = True  # Set authenticated directly for this test
+
+    result = bluesky_client.get_recent_posts()
+
+    assert result.posts == []
+    assert (
+        result.total_retrieved,
+        result.filtered_replies,
+        result.filtered_reposts,
+        result.filtered_by_date,
+        result.filtered_quotes,
+    ) == (0, 0, 0, 0, 0)
+    assert atproto_mock.get_author_feed.call_count == 1
+
+
+def test_get_recent_posts_with_posts(bluesky_client, atproto_mock, make_feed_item):
+    """Test getting recent posts with actual posts"""
+    atproto_mock.get_author_feed.return_value.feed = [make_feed_item()]
+
+    bluesky_client._authenticated = True  # Set authenticated directly for this test
+
+    result = bluesky_client.get_recent_posts(limit=10)
+
+    assert len(result.posts) == 1
+    assert (
+        result.total_retrieved,
+        result.filtered_replies,
+        result.filtered_reposts,
+        result.filtered_by_date,
+    ) == (1, 0, 0, 0)
+
+    post = result.posts[0]
+    assert isinstance(post, BlueskyPost)
+    assert (post.uri, post.text, post.author_handle, post.author_display_name) == (
+        _post_uri("12345"),
+        "Test post content",
+        _TEST_HANDLE,
+        "Test User",
+    )
+
+
+@pytest.mark.parametrize(
+    "root_uri,parent_uri,included",
+    [
+        # Reply to someone else's post
+        pytest.param(
+            _post_uri("their-post", _OTHER_DID),
+            _post_uri("their-post", _OTHER_DID),
+            False,
+            id="reply-to-others-post",
+        ),
+        # Reply to own post
+        pytest.param(
+            _post_uri("original-post"),
+            _post_uri("original-post"),
+            True,
+            id="self-reply-to-own-post",
+        ),
+        # Reply to own reply in a thread started by someone else (the original bug)
+        pytest.param(
+            _post_uri("their-post", _OTHER_DID),
+            _post_uri("users-reply"),
+            False,
+            id="nested-reply-in-others-thread",
+        ),
+        # Reply to own reply in own thread
+        pytest.param(
+            _post_uri("original-post"),
+            _post_uri("first-reply"),
+            True,
+            id="deep-nested-self-reply",
+        ),
+        # Reply to someone else's reply in own thread
+        pytest.param(
+            _post_uri("original-post"),
+            _post_uri("their-reply", _OTHER_DID),
+            False,
+            id="reply-to-others-reply-in-own-thread",
+        ),
+    ],
+)
+def test_get_recent_posts_reply_filtering(
+    bluesky_client, atproto_mock, make_feed_item, root_uri, parent_uri, included
+):
+    """Test that only replies whose thread root and parent are both the user's are kept"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(
+            text="This is a reply",
+            reply=_reply_ref(root_uri, parent_uri),
+            uri=_post_uri("reply-post"),
+            cid="reply-cid",
         )
-
-        mock_post_record = Mock()
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-        mock_post_record.text = "This is a reply"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = (
-            mock_reply  # This should cause the post to be filtered out
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts()
+
+    assert len(result.posts) == (1 if included else 0)
+    assert (
+        result.total_retrieved,
+        result.filtered_replies,
+        result.filtered_reposts,
+        result.filtered_by_date,
+    ) == (1, 0 if included else 1, 0, 0)
+    if included:
+        assert (result.posts[0].text, result.posts[0].reply_to) == (
+            "This is a reply",
+            parent_uri,
         )
 
-        mock_feed_item = Mock()
-        # Ensure no 'reason' attribute (no repost)
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/reply-post"
-        mock_feed_item.post.cid = "reply-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        result = client.get_recent_posts()
-
-        # Reply posts to others should be filtered out
-        assert len(result.posts) == 0
-        assert result.total_retrieved == 1  # One post was retrieved from API
-        assert result.filtered_replies == 1  # One reply was filtered out
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_self_reply_to_own_post(self, mock_client_class):
-        """Test that self-replies to own posts are included"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock self-reply: reply to own post
-        mock_reply = Mock()
-        mock_reply.root = Mock()
-        mock_reply.root.uri = "at://did:plc:test123/app.bsky.feed.post/original-post"
-        mock_reply.parent = Mock()
-        mock_reply.parent.uri = "at://did:plc:test123/app.bsky.feed.post/original-post"
-
-        mock_post_record = Mock()
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-        mock_post_record.text = "This is a self-reply"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = mock_reply
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/self-reply"
-        mock_feed_item.post.cid = "self-reply-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts()
-
-        # Self-replies should be included
-        assert len(result.posts) == 1
-        assert result.total_retrieved == 1
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-        assert result.posts[0].text == "This is a self-reply"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_nested_reply_in_others_thread(
-        self, mock_client_class
-    ):
-        """Test that nested replies in threads started by others are filtered out
-
-        This tests the bug fix: A reply to a self-reply that is itself part of
-        someone else's thread should be filtered out.
-
-        Thread structure:
-        1. Someone else's post (root)
-        2. User's reply to that post (would be filtered, not shown here)
-        3. User's reply to their own reply (should be filtered - this is the bug)
-        """
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock nested reply: reply to own reply, but root is someone else's post
-        mock_reply = Mock()
-        mock_reply.root = Mock()
-        # Root is someone else's post
-        mock_reply.root.uri = "at://did:plc:otheruser456/app.bsky.feed.post/their-post"
-        mock_reply.parent = Mock()
-        # Parent is user's own reply
-        mock_reply.parent.uri = "at://did:plc:test123/app.bsky.feed.post/users-reply"
-
-        mock_post_record = Mock()
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-        mock_post_record.text = "Reply to my reply in someone else's thread"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = mock_reply
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/nested-reply"
-        mock_feed_item.post.cid = "nested-reply-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts()
-
-        # Nested reply in someone else's thread should be filtered out
-        assert len(result.posts) == 0
-        assert result.total_retrieved == 1
-        assert result.filtered_replies == 1
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_deep_nested_self_replies(self, mock_client_class):
-        """Test that deeply nested self-replies in own threads are included
-
-        Thread structure:
-        1. User's original post (root)
-        2. User's reply to their own post
-        3. User's reply to their reply (deeply nested)
-        """
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock deeply nested self-reply
-        mock_reply = Mock()
-        mock_reply.root = Mock()
-        # Root is user's own post
-        mock_reply.root.uri = "at://did:plc:test123/app.bsky.feed.post/original-post"
-        mock_reply.parent = Mock()
-        # Parent is also user's own reply
-        mock_reply.parent.uri = "at://did:plc:test123/app.bsky.feed.post/first-reply"
-
-        mock_post_record = Mock()
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-        mock_post_record.text = "Deep nested reply in my own thread"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = mock_reply
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = (
-            "at://did:plc:test123/app.bsky.feed.post/deep-nested-reply"
-        )
-        mock_feed_item.post.cid = "deep-nested-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts()
-
-        # Deep nested self-replies in own thread should be included
-        assert len(result.posts) == 1
-        assert result.total_retrieved == 1
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-        assert result.posts[0].text == "Deep nested reply in my own thread"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_since_date_filter(self, mock_client_class):
-        """Test that posts are filtered by since_date"""
-        mock_client = Mock()
-        mock_session = Mock()
-        mock_session.handle = "test.bsky.social"
 
+def test_get_recent_posts_with_since_date_filter(
+    bluesky_client, atproto_mock, make_feed_item
+):
+    """Test that posts are filtered by since_date"""
+    atproto_mock.get_author_feed.return_value.feed = [
         # Old post (should be filtered out)
-        mock_old_post_record = Mock()
-        mock_old_post_record.text = "Old post"
-        mock_old_post_record.created_at = "2024-12-01T10:00:00.000Z"
-        mock_old_post_record.facets = []
-        mock_old_post_record.embed = None
-        mock_old_post_record.reply = None
-        mock_old_post_record.labels = None
-        mock_old_post_record.langs = None
-
-        mock_old_feed_item = Mock()
-        # Ensure no 'reason' attribute (no repost)
-        if hasattr(mock_old_feed_item, "reason"):
-            delattr(mock_old_feed_item, "reason")
-
-        mock_old_feed_item.post = Mock()
-        mock_old_feed_item.post.uri = "at://old-post-uri"
-        mock_old_feed_item.post.cid = "old-cid"
-        mock_old_feed_item.post.record = mock_old_post_record
-        mock_old_feed_item.post.author = Mock()
-        mock_old_feed_item.post.author.handle = "test.bsky.social"
-        mock_old_feed_item.post.author.display_name = "Test User"
-
+        make_feed_item(
+            text="Old post",
+            created_at=_POST_DATE_OLD,
+            uri="at://old-post-uri",
+            cid="old-cid",
+        ),
         # New post (should be included)
-        mock_new_post_record = Mock()
-        mock_new_post_record.text = "New post"
-        mock_new_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_new_post_record.facets = []
-        mock_new_post_record.embed = None
-        mock_new_post_record.reply = None
-        mock_new_post_record.labels = None
-        mock_new_post_record.langs = None
-
-        mock_new_feed_item = Mock()
-        # Ensure no 'reason' attribute (no repost)
-        if hasattr(mock_new_feed_item, "reason"):
-            delattr(mock_new_feed_item, "reason")
-
-        mock_new_feed_item.post = Mock()
-        mock_new_feed_item.post.uri = "at://new-post-uri"
-        mock_new_feed_item.post.cid = "new-cid"
-        mock_new_feed_item.post.record = mock_new_post_record
-        mock_new_feed_item.post.author = Mock()
-        mock_new_feed_item.post.author.handle = "test.bsky.social"
-        mock_new_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_old_feed_item, mock_new_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        since_date = datetime(2024, 12, 31, tzinfo=timezone.utc)
-        result = client.get_recent_posts(since_date=since_date)
-
-        assert len(result.posts) == 1
-        assert result.posts[0].text == "New post"
-        assert result.total_retrieved == 2  # Two posts retrieved
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 1  # One filtered by date
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_with_embed(self, mock_client_class):
-        """Test getting posts with embed content"""
-        mock_client = Mock()
-        mock_session = Mock()
-        mock_session.handle = "test.bsky.social"
-
-        # Mock embed data
-        mock_embed = {
-            "$type": "app.bsky.embed.external",
-            "external": {
-                "uri": "https://example.com",
-                "title": "Example Site",
-                "description": "Test description",
-            },
-        }
-
-        mock_post_record = Mock()
-        mock_post_record.text = "Check this out"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = mock_embed
-        mock_post_record.reply = None
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        # Ensure no 'reason' attribute (no repost)
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://post-with-embed"
-        mock_feed_item.post.cid = "embed-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated directly for this test
-
-        result = client.get_recent_posts()
-
-        assert len(result.posts) == 1
-        assert result.total_retrieved == 1
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-
-        post = result.posts[0]
-        assert post.embed is not None
-        assert post.embed["py_type"] == "dict"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_post_thread(self, mock_client_class):
-        """Test getting post thread"""
-        mock_client = Mock()
-        mock_thread_response = Mock()
-        # Make thread a dict to match the implementation expectation
-        mock_thread_response.thread = {"post": {"uri": "at://test-post-uri"}}
-        mock_client.get_post_thread.return_value = mock_thread_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-
-        result = client.get_post_thread("at://test-post-uri")
-
-        assert result == {"post": {"uri": "at://test-post-uri"}}
-        mock_client.get_post_thread.assert_called_once_with(uri="at://test-post-uri")
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_post_thread_error(self, mock_client_class):
-        """Test getting post thread with error"""
-        mock_client = Mock()
-        mock_client.get_post_thread.side_effect = Exception("Thread not found")
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-
-        result = client.get_post_thread("at://invalid-uri")
-
-        assert result is None
-
-    @patch("src.bluesky_client.AtprotoClient")
-    @patch("src.bluesky_client.requests.get")
-    def test_download_blob_success(self, mock_get, mock_client_class):
-        """Test successful blob download"""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-
-        # Mock successful HTTP response
-        mock_response = Mock()
-        mock_response.content = b"fake_image_data"
-        mock_response.headers = {"content-type": "image/jpeg"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Set authenticated for blob download
-
-        result = client.download_blob("test-blob-ref", "did:plc:test123")
-
-        assert result is not None
-        content, mime_type = result
-        assert content == b"fake_image_data"
-        assert mime_type == "image/jpeg"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    @patch("src.bluesky_client.requests.get")
-    def test_download_blob_failure(self, mock_get, mock_client_class):
-        """Test failed blob download"""
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-
-        mock_get.side_effect = Exception("Network error")
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-
-        result = client.download_blob("test-blob-ref", "did:plc:test123")
-
-        assert result is None
-
-    def test_extract_facets_data_empty(self):
-        """Test extracting facets data from empty facets"""
-        result = BlueskyClient._extract_facets_data([])
-        assert result == []
-
-    def test_extract_facets_data_with_links(self):
-        """Test extracting facets data with links"""
-        # Create Mock objects that behave like AT Protocol facet objects
-        mock_index = Mock()
-        mock_index.byte_start = 0
-        mock_index.byte_end = 10
-
-        mock_feature = Mock()
-        mock_feature.uri = "https://example.com"
-
-        mock_facet = Mock()
-        mock_facet.index = mock_index
-        mock_facet.features = [mock_feature]
-
-        facets = [mock_facet]
-
-        result = BlueskyClient._extract_facets_data(facets)
-
-        assert len(result) == 1
-        assert result[0]["index"]["byteStart"] == 0
-        assert result[0]["index"]["byteEnd"] == 10
-        assert result[0]["features"][0]["uri"] == "https://example.com"
-
-    def test_extract_embed_data_none(self):
-        """Test extracting embed data from None"""
-        result = BlueskyClient._extract_embed_data(None)
-        assert result == {"py_type": "NoneType"}
-
-    def test_extract_embed_data_external(self):
-        """Test extracting external embed data"""
-        # Create Mock objects that behave like AT Protocol embed objects
-        mock_external = Mock()
-        mock_external.uri = "https://example.com"
-        mock_external.title = "Example"
-        mock_external.description = "Test description"
-
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.external"
-        mock_embed.external = mock_external
-        # Ensure images attribute doesn't exist to avoid iteration issues
-        if hasattr(mock_embed, "images"):
-            delattr(mock_embed, "images")
-        # Ensure media attribute doesn't exist to isolate testing of external embed without recordWithMedia behavior
-        if hasattr(mock_embed, "media"):
-            delattr(mock_embed, "media")
-        # Ensure record attribute doesn't exist to avoid issues
-        if hasattr(mock_embed, "record"):
-            delattr(mock_embed, "record")
-
-        result = BlueskyClient._extract_embed_data(mock_embed)
-
-        assert result is not None
-        assert result["py_type"] == "app.bsky.embed.external"
-        assert result["external"]["uri"] == "https://example.com"
-        assert result["external"]["title"] == "Example"
-
-    def test_extract_embed_data_images_with_blob_reference(self):
-        """Test extracting image embed data with blob reference - fix for image attachment bug"""
-        # Create Mock objects that simulate AT Protocol image embed with blob reference
-        mock_blob_ref = Mock()
-        mock_blob_ref.link = (
-            "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
+        make_feed_item(
+            text="New post",
+            created_at=_POST_DATE_NEW,
+            uri="at://new-post-uri",
+            cid="new-cid",
+        ),
+    ]
+
+    bluesky_client._authenticated = True  # Set authenticated directly for this test
+
+    result = bluesky_client.get_recent_posts(since_date=_SINCE_DATE_REF)
+
+    assert len(result.posts) == 1
+    assert result.posts[0].text == "New post"
+    # Two posts retrieved, one filtered by date
+    assert (
+        result.total_retrieved,
+        result.filtered_replies,
+        result.filtered_reposts,
+        result.filtered_by_date,
+    ) == (2, 0, 0, 1)
+
+
+def test_get_recent_posts_with_embed(bluesky_client, atproto_mock, make_feed_item):
+    """Test getting posts with embed content"""
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(
+            text="Check this out",
+            embed=_EXTERNAL_EMBED_DICT,
+            uri="at://post-with-embed",
+            cid="embed-cid",
         )
+    ]
 
-        mock_image_blob = Mock()
-        mock_image_blob.mime_type = "image/jpeg"
-        mock_image_blob.size = 187302
-        mock_image_blob.ref = mock_blob_ref
-
-        mock_aspect_ratio = Mock()
-        mock_aspect_ratio.height = 414
-        mock_aspect_ratio.width = 1748
-        mock_aspect_ratio.py_type = "app.bsky.embed.defs#aspectRatio"
-
-        mock_image = Mock()
-        mock_image.alt = ""
-        mock_image.aspect_ratio = mock_aspect_ratio
-        mock_image.image = mock_image_blob
-
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.images"
-        mock_embed.images = [mock_image]
-        # Ensure other attributes don't exist
-        if hasattr(mock_embed, "external"):
-            delattr(mock_embed, "external")
-        if hasattr(mock_embed, "media"):
-            delattr(mock_embed, "media")
-        if hasattr(mock_embed, "record"):
-            delattr(mock_embed, "record")
-
-        result = BlueskyClient._extract_embed_data(mock_embed)
-
-        # Verify the result contains proper blob reference
-        assert result is not None
-        assert result["py_type"] == "app.bsky.embed.images"
-        assert "images" in result
-        assert len(result["images"]) == 1
-
-        image_data = result["images"][0]
-        assert image_data["alt"] == ""
-        assert image_data["aspect_ratio"] == mock_aspect_ratio
-        assert "image" in image_data
-
-        blob_data = image_data["image"]
-        assert blob_data["mime_type"] == "image/jpeg"
-        assert blob_data["size"] == 187302
-        # This is the key fix - blob reference should be extracted
-        assert "ref" in blob_data
-        assert (
-            blob_data["ref"]["$link"]
-            == "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
-        )
+    bluesky_client._authenticated = True  # Set authenticated directly for this test
 
-    def test_extract_embed_data_multiple_images_with_blob_references(self):
-        """Test extracting multiple image embed data with blob references"""
-        # Create Mock objects for first image
-        mock_blob_ref1 = Mock()
-        mock_blob_ref1.link = (
-            "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
-        )
+    result = bluesky_client.get_recent_posts()
 
-        mock_image_blob1 = Mock()
-        mock_image_blob1.mime_type = "image/jpeg"
-        mock_image_blob1.size = 187302
-        mock_image_blob1.ref = mock_blob_ref1
+    assert len(result.posts) == 1
+    assert (
+        result.total_retrieved,
+        result.filtered_replies,
+        result.filtered_reposts,
+        result.filtered_by_date,
+    ) == (1, 0, 0, 0)
 
-        mock_aspect_ratio1 = Mock()
-        mock_aspect_ratio1.height = 414
-        mock_aspect_ratio1.width = 1748
+    post = result.posts[0]
+    assert post.embed is not None
+    assert post.embed["py_type"] == "dict"
 
-        mock_image1 = Mock()
-        mock_image1.alt = "First image"
-        mock_image1.aspect_ratio = mock_aspect_ratio1
-        mock_image1.image = mock_image_blob1
 
-        # Create Mock objects for second image
-        mock_blob_ref2 = Mock()
-        mock_blob_ref2.link = (
-            "bafkreiabcdefghijklmnopqrstuvwxyz1234567890abcdefghijklmnop"
+def test_get_post_thread(bluesky_client, atproto_mock):
+    """Test getting post thread"""
+    # Make thread a dict to match the implementation expectation
+    atproto_mock.get_post_thread.return_value = SimpleNamespace(
+        thread={"post": {"uri": "at://test-post-uri"}}
+    )
+
+    result = bluesky_client.get_post_thread("at://test-post-uri")
+
+    assert result == {"post": {"uri": "at://test-post-uri"}}
+    assert atproto_mock.get_post_thread.call_count == 1
+    assert atproto_mock.get_post_thread.call_args == call(uri="at://test-post-uri")
+
+
+@pytest.fixture
+def mock_requests_get(mocker):
+    """Stand-in for the HTTP GET used by download_blob"""
+    return mocker.patch("src.bluesky_client.requests.get")
+
+
+def test_download_blob_success(mock_requests_get, bluesky_client):
+    """Test successful blob download"""
+    # Successful HTTP response; the client only reads these three attributes
+    mock_requests_get.return_value = SimpleNamespace(
+        content=b"fake_image_data",
+        headers={"content-type": "image/jpeg"},
+        raise_for_status=lambda: None,
+    )
+
+    bluesky_client._authenticated = True  # Set authenticated for blob download
+
+    result = bluesky_client.download_blob("test-blob-ref", _TEST_DID)
+
+    assert result is not None
+    content, mime_type = result
+    assert content == b"fake_image_data"
+    assert mime_type == "image/jpeg"
+
+
+def test_download_blob_failure(mock_requests_get, bluesky_client):
+    """Test failed blob download"""
+    mock_requests_get.side_effect = Exception("Network error")
+
+    # Reach the HTTP request rather than the auth guard
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.download_blob("test-blob-ref", _TEST_DID)
+
+    assert result is None
+    assert mock_requests_get.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "extractor,value,expected",
+    [
+        pytest.param(BlueskyClient._extract_facets_data, [], [], id="facets-empty"),
+        pytest.param(
+            BlueskyClient._extract_embed_data,
+            None,
+            {"py_type": "NoneType"},
+            id="embed-none",
+        ),
+    ],
+)
+def test_extractors_degenerate_input(extractor, value, expected):
+    """Test the facet and embed extractors on empty/None input"""
+    assert extractor(value) == expected
+
+
+def test_extract_facets_data_with_links():
+    """Test extracting facets data with links"""
+    result = BlueskyClient._extract_facets_data(_LINK_FACETS)
+
+    assert len(result) == 1
+    assert result[0]["index"]["byteStart"] == 0
+    assert result[0]["index"]["byteEnd"] == 10
+    assert result[0]["features"][0]["uri"] == "https://example.com"
+
+
+def test_extract_embed_data_external():
+    """Test extracting external embed data"""
+    result = BlueskyClient._extract_embed_data(_EXTERNAL_EMBED)
+
+    assert result is not None
+    assert result["py_type"] == "app.bsky.embed.external"
+    assert result["external"]["uri"] == "https://example.com"
+    assert result["external"]["title"] == "Example"
+
+
+def test_extract_embed_data_images_with_blob_reference():
+    """Test extracting image embed data with blob reference - fix for image attachment bug"""
+    # Simulate an AT Protocol image embed with a blob reference
+    aspect_ratio = SimpleNamespace(
+        height=414, width=1748, py_type="app.bsky.embed.defs#aspectRatio"
+    )
+    image = SimpleNamespace(
+        alt="",
+        aspect_ratio=aspect_ratio,
+        image=SimpleNamespace(
+            mime_type="image/jpeg",
+            size=187302,
+            ref=SimpleNamespace(
+                link="bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
+            ),
+        ),
+    )
+    embed = SimpleNamespace(py_type="app.bsky.embed.images", images=[image])
+
+    result = BlueskyClient._extract_embed_data(embed)
+
+    # Verify the result contains proper blob reference
+    assert result is not None
+    assert result["py_type"] == "app.bsky.embed.images"
+    assert "images" in result
+    assert len(result["images"]) == 1
+
+    image_data = result["images"][0]
+    assert image_data["alt"] == ""
+    assert image_data["aspect_ratio"] == aspect_ratio
+    assert "image" in image_data
+
+    blob_data = image_data["image"]
+    assert blob_data["mime_type"] == "image/jpeg"
+    assert blob_data["size"] == 187302
+    # This is the key fix - blob reference should be extracted
+    assert "ref" in blob_data
+    assert (
+        blob_data["ref"]["$link"]
+        == "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
+    )
+
+
+def test_extract_embed_data_multiple_images_with_blob_references():
+    """Test extracting multiple image embed data with blob references"""
+    aspect_ratio1 = SimpleNamespace(height=414, width=1748)
+    image1 = SimpleNamespace(
+        alt="First image",
+        aspect_ratio=aspect_ratio1,
+        image=SimpleNamespace(
+            mime_type="image/jpeg",
+            size=187302,
+            ref=SimpleNamespace(
+                link="bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
+            ),
+        ),
+    )
+
+    aspect_ratio2 = SimpleNamespace(height=800, width=600)
+    image2 = SimpleNamespace(
+        alt="Second image",
+        aspect_ratio=aspect_ratio2,
+        image=SimpleNamespace(
+            mime_type="image/png",
+            size=245678,
+            ref=SimpleNamespace(
+                link="bafkreiabcdefghijklmnopqrstuvwxyz1234567890abcdefghijklmnop"
+            ),
+        ),
+    )
+
+    # Create embed with multiple images
+    embed = SimpleNamespace(py_type="app.bsky.embed.images", images=[image1, image2])
+
+    result = BlueskyClient._extract_embed_data(embed)
+
+    # Verify the result contains both images with proper blob references
+    assert result is not None
+    assert result["py_type"] == "app.bsky.embed.images"
+    assert "images" in result
+    assert len(result["images"]) == 2
+
+    # Verify first image
+    image1_data = result["images"][0]
+    assert image1_data["alt"] == "First image"
+    assert image1_data["aspect_ratio"] == aspect_ratio1
+    assert "image" in image1_data
+
+    blob1_data = image1_data["image"]
+    assert blob1_data["mime_type"] == "image/jpeg"
+    assert blob1_data["size"] == 187302
+    assert "ref" in blob1_data
+    assert (
+        blob1_data["ref"]["$link"]
+        == "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
+    )
+
+    # Verify second image
+    image2_data = result["images"][1]
+    assert image2_data["alt"] == "Second image"
+    assert image2_data["aspect_ratio"] == aspect_ratio2
+    assert "image" in image2_data
+
+    blob2_data = image2_data["image"]
+    assert blob2_data["mime_type"] == "image/png"
+    assert blob2_data["size"] == 245678
+    assert "ref" in blob2_data
+    assert (
+        blob2_data["ref"]["$link"]
+        == "bafkreiabcdefghijklmnopqrstuvwxyz1234567890abcdefghijklmnop"
+    )
+
+
+@pytest.mark.parametrize(
+    "failing_call,error,method,args,expected",
+    [
+        pytest.param(
+            "login",
+            ConnectionError("Connection timeout"),
+            "authenticate",
+            (),
+            False,
+            id="authenticate-timeout",
+        ),
+        pytest.param(
+            "login",
+            Exception("Authentication failed"),
+            "authenticate",
+            (),
+            False,
+            id="authenticate-rejected",
+        ),
+        pytest.param(
+            "login",
+            Exception("Rate limit exceeded"),
+            "authenticate",
+            (),
+            False,
+            id="authenticate-rate-limit",
+        ),
+        pytest.param(
+            "get_author_feed",
+            ConnectionError("Network unreachable"),
+            "get_recent_posts",
+            (),
+            _EMPTY_FETCH_RESULT,
+            id="get-recent-posts",
+        ),
+        pytest.param(
+            "get_post_thread",
+            ConnectionError("Network unreachable"),
+            "get_post_thread",
+            ("at://test-uri",),
+            None,
+            id="get-post-thread",
+        ),
+    ],
+)
+def test_network_errors_handled_gracefully(
+    bluesky_client, atproto_mock, failing_call, error, method, args, expected
+):
+    """Test AT Protocol call failures are reported as results instead of raised"""
+    getattr(atproto_mock, failing_call).side_effect = error
+    # Only login itself runs unauthenticated; the other calls need a session
+    authenticated = failing_call != "login"
+    bluesky_client._authenticated = authenticated
+
+    result = getattr(bluesky_client, method)(*args)
+
+    assert result == expected
+    assert bluesky_client._authenticated is authenticated
+
+
+def test_extract_embed_data_record_with_media():
+    """Test extracting recordWithMedia embed data (quoted post with images)"""
+    # This tests the fix for the bug where images in quoted posts weren't synced
+    # recordWithMedia embeds have images nested in embed.media.images instead of embed.images
+
+    def image(link, size):
+        return SimpleNamespace(
+            alt="",
+            image=SimpleNamespace(
+                mime_type="image/jpeg", size=size, ref=SimpleNamespace(link=link)
+            ),
         )
 
-        mock_image_blob2 = Mock()
-        mock_image_blob2.mime_type = "image/png"
-        mock_image_blob2.size = 245678
-        mock_image_blob2.ref = mock_blob_ref2
-
-        mock_aspect_ratio2 = Mock()
-        mock_aspect_ratio2.height = 800
-        mock_aspect_ratio2.width = 600
-
-        mock_image2 = Mock()
-        mock_image2.alt = "Second image"
-        mock_image2.aspect_ratio = mock_aspect_ratio2
-        mock_image2.image = mock_image_blob2
-
-        # Create embed with multiple images
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.images"
-        mock_embed.images = [mock_image1, mock_image2]
-        if hasattr(mock_embed, "external"):
-            delattr(mock_embed, "external")
-        if hasattr(mock_embed, "media"):
-            delattr(mock_embed, "media")
-        if hasattr(mock_embed, "record"):
-            delattr(mock_embed, "record")
-
-        result = BlueskyClient._extract_embed_data(mock_embed)
-
-        # Verify the result contains both images with proper blob references
-        assert result is not None
-        assert result["py_type"] == "app.bsky.embed.images"
-        assert "images" in result
-        assert len(result["images"]) == 2
-
-        # Verify first image
-        image1_data = result["images"][0]
-        assert image1_data["alt"] == "First image"
-        assert image1_data["aspect_ratio"] == mock_aspect_ratio1
-        assert "image" in image1_data
-
-        blob1_data = image1_data["image"]
-        assert blob1_data["mime_type"] == "image/jpeg"
-        assert blob1_data["size"] == 187302
-        assert "ref" in blob1_data
-        assert (
-            blob1_data["ref"]["$link"]
-            == "bafkreihitajnhlutyalbqxutmfifkjxxrdqgl5basih3i7z2rjnmwpo4ya"
-        )
+    # No top-level `images`/`external`: recordWithMedia nests images in media.images
+    embed = SimpleNamespace(
+        py_type="app.bsky.embed.recordWithMedia",
+        media=SimpleNamespace(
+            py_type="app.bsky.embed.images",
+            images=[
+                image(
+                    "bafkreiett2bw6haj672k7l6gk32dwqdd27j3ks6hgsokhxkgyixr4we77i",
+                    600344,
+                ),
+                image(
+                    "bafkreignydqmw2pqgm7jo3g4jnuu6ztr53fy26llwoul2gtkd6n7xkvvce",
+                    730298,
+                ),
+            ],
+        ),
+        # Record object for the quoted post
+        record=SimpleNamespace(py_type="app.bsky.embed.record"),
+    )
+
+    result = BlueskyClient._extract_embed_data(embed)
+
+    # Verify the result contains images from media.images
+    assert result is not None
+    assert result["py_type"] == "app.bsky.embed.recordWithMedia"
+    assert "images" in result, "Images should be extracted from media.images"
+    assert len(result["images"]) == 2, "Should extract all images from media"
+
+    # Verify first image
+    image1_data = result["images"][0]
+    assert image1_data["alt"] == ""
+    assert "image" in image1_data
+    blob1_data = image1_data["image"]
+    assert blob1_data["mime_type"] == "image/jpeg"
+    assert blob1_data["size"] == 600344
+    assert "ref" in blob1_data
+    assert (
+        blob1_data["ref"]["$link"]
+        == "bafkreiett2bw6haj672k7l6gk32dwqdd27j3ks6hgsokhxkgyixr4we77i"
+    )
 
-        # Verify second image
-        image2_data = result["images"][1]
-        assert image2_data["alt"] == "Second image"
-        assert image2_data["aspect_ratio"] == mock_aspect_ratio2
-        assert "image" in image2_data
-
-        blob2_data = image2_data["image"]
-        assert blob2_data["mime_type"] == "image/png"
-        assert blob2_data["size"] == 245678
-        assert "ref" in blob2_data
-        assert (
-            blob2_data["ref"]["$link"]
-            == "bafkreiabcdefghijklmnopqrstuvwxyz1234567890abcdefghijklmnop"
-        )
+    # Verify second image
+    image2_data = result["images"][1]
+    assert image2_data["alt"] == ""
+    assert "image" in image2_data
+    blob2_data = image2_data["image"]
+    assert blob2_data["mime_type"] == "image/jpeg"
+    assert blob2_data["size"] == 730298
+    assert "ref" in blob2_data
+    assert (
+        blob2_data["ref"]["$link"]
+        == "bafkreignydqmw2pqgm7jo3g4jnuu6ztr53fy26llwoul2gtkd6n7xkvvce"
+    )
 
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_authenticate_network_timeout(self, mock_client_class):
-        """Test authentication failure due to network timeout"""
-        mock_client = Mock()
-        mock_client.login.side_effect = ConnectionError("Connection timeout")
-        mock_client_class.return_value = mock_client
+    # Verify record is also preserved
+    assert "record" in result
 
-        client = BlueskyClient("test.bsky.social", "test-password")
-        result = client.authenticate()
 
-        assert result is False
-        assert client._authenticated is False
+def test_extract_self_labels_from_post(bluesky_client, atproto_mock, make_feed_item):
+    """Test extraction of self-labels from post records"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
 
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_authenticate_rate_limit_error(self, mock_client_class):
-        """Test authentication failure due to rate limiting"""
-        mock_client = Mock()
-        mock_client.login.side_effect = Exception("Rate limit exceeded")
-        mock_client_class.return_value = mock_client
+    labels = SimpleNamespace(
+        values=[SimpleNamespace(val="porn"), SimpleNamespace(val="nudity")]
+    )
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Test post with labels", labels=labels)
+    ]
 
-        client = BlueskyClient("test.bsky.social", "test-password")
-        result = client.authenticate()
+    bluesky_client._authenticated = True
 
-        assert result is False
-        assert client._authenticated is False
+    result = bluesky_client.get_recent_posts(limit=10)
 
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_recent_posts_network_error(self, mock_client_class):
-        """Test get_recent_posts handling network errors gracefully"""
-        mock_client = Mock()
-        mock_client.get_author_feed.side_effect = ConnectionError("Network unreachable")
-        mock_client_class.return_value = mock_client
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.self_labels == ["porn", "nudity"]
 
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Simulate authenticated state
 
-        # Verify it returns empty result instead of crashing
-        result = client.get_recent_posts()
+def test_extract_single_self_label(bluesky_client, atproto_mock, make_feed_item):
+    """Test extraction of a single self-label"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
 
-        assert isinstance(result, BlueskyFetchResult)
-        assert result.total_retrieved == 0
+    labels = SimpleNamespace(values=[SimpleNamespace(val="graphic-media")])
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Test post with single label", labels=labels)
+    ]
 
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_get_post_thread_network_error(self, mock_client_class):
-        """Test get_post_thread handling network errors gracefully"""
-        mock_client = Mock()
-        mock_client.get_post_thread.side_effect = ConnectionError("Network unreachable")
-        mock_client_class.return_value = mock_client
+    bluesky_client._authenticated = True
 
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True  # Simulate authenticated state
+    result = bluesky_client.get_recent_posts(limit=10)
 
-        result = client.get_post_thread("at://test-uri")
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.self_labels == ["graphic-media"]
 
-        assert result is None
 
-    def test_extract_embed_data_record_with_media(self):
-        """Test extracting recordWithMedia embed data (quoted post with images)"""
-        # This tests the fix for the bug where images in quoted posts weren't synced
-        # recordWithMedia embeds have images nested in embed.media.images instead of embed.images
+def test_post_without_self_labels(bluesky_client, atproto_mock, make_feed_item):
+    """Test that posts without labels have None for self_labels"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
 
-        # Create Mock objects for images (same structure as direct images)
-        mock_blob_ref1 = Mock()
-        mock_blob_ref1.link = (
-            "bafkreiett2bw6haj672k7l6gk32dwqdd27j3ks6hgsokhxkgyixr4we77i"
-        )
+    # Labels default to None to indicate no labels
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Test post without labels")
+    ]
 
-        mock_image_blob1 = Mock()
-        mock_image_blob1.mime_type = "image/jpeg"
-        mock_image_blob1.size = 600344
-        mock_image_blob1.ref = mock_blob_ref1
+    bluesky_client._authenticated = True
 
-        mock_image1 = Mock()
-        mock_image1.alt = ""
-        mock_image1.image = mock_image_blob1
+    result = bluesky_client.get_recent_posts(limit=10)
 
-        mock_blob_ref2 = Mock()
-        mock_blob_ref2.link = (
-            "bafkreignydqmw2pqgm7jo3g4jnuu6ztr53fy26llwoul2gtkd6n7xkvvce"
-        )
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.self_labels is None
+
+
+def test_extract_language_tags_single(bluesky_client, atproto_mock, make_feed_item):
+    """Test extraction of single language tag from post"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
+
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Test post in English", langs=["en"])
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts(limit=10)
+
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.langs == ["en"]
+
+
+def test_extract_language_tags_multiple(bluesky_client, atproto_mock, make_feed_item):
+    """Test extraction of multiple language tags from post"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
+
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Bilingual post / Post bilingüe", langs=["en", "es"])
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts(limit=10)
 
-        mock_image_blob2 = Mock()
-        mock_image_blob2.mime_type = "image/jpeg"
-        mock_image_blob2.size = 730298
-        mock_image_blob2.ref = mock_blob_ref2
-
-        mock_image2 = Mock()
-        mock_image2.alt = ""
-        mock_image2.image = mock_image_blob2
-
-        # Create media object that contains the images
-        mock_media = Mock()
-        mock_media.py_type = "app.bsky.embed.images"
-        mock_media.images = [mock_image1, mock_image2]
-
-        # Create record object for the quoted post
-        mock_record = Mock()
-        mock_record.py_type = "app.bsky.embed.record"
-
-        # Create the recordWithMedia embed
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.recordWithMedia"
-        mock_embed.media = mock_media
-        mock_embed.record = mock_record
-        # Ensure 'images' attribute doesn't exist at top level since recordWithMedia stores images in media.images instead
-        if hasattr(mock_embed, "images"):
-            delattr(mock_embed, "images")
-        # Ensure 'external' doesn't exist
-        if hasattr(mock_embed, "external"):
-            delattr(mock_embed, "external")
-
-        result = BlueskyClient._extract_embed_data(mock_embed)
-
-        # Verify the result contains images from media.images
-        assert result is not None
-        assert result["py_type"] == "app.bsky.embed.recordWithMedia"
-        assert "images" in result, "Images should be extracted from media.images"
-        assert len(result["images"]) == 2, "Should extract all images from media"
-
-        # Verify first image
-        image1_data = result["images"][0]
-        assert image1_data["alt"] == ""
-        assert "image" in image1_data
-        blob1_data = image1_data["image"]
-        assert blob1_data["mime_type"] == "image/jpeg"
-        assert blob1_data["size"] == 600344
-        assert "ref" in blob1_data
-        assert (
-            blob1_data["ref"]["$link"]
-            == "bafkreiett2bw6haj672k7l6gk32dwqdd27j3ks6hgsokhxkgyixr4we77i"
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.langs == ["en", "es"]
+
+
+def test_post_without_language_tags(bluesky_client, atproto_mock, make_feed_item):
+    """Test that posts without language tags have None for langs"""
+    atproto_mock.me = SimpleNamespace(did=_TEST_DID)
+
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(text="Post without language metadata")
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts(limit=10)
+
+    assert len(result.posts) == 1
+    post = result.posts[0]
+    assert post.langs is None
+
+
+def test_filter_quote_posts_of_others(bluesky_client, atproto_mock, make_feed_item):
+    """Test that quote posts of other people's content are filtered out"""
+    atproto_mock.me = SimpleNamespace(did="did:plc:userA")
+
+    # Quote post embed (quoting someone else's post)
+    embed = SimpleNamespace(
+        py_type="app.bsky.embed.record",
+        record=SimpleNamespace(uri=_post_uri("quoted123", "did:plc:userB")),
+    )
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(
+            text="Check this out!",
+            embed=embed,
+            uri=_post_uri("12345", "did:plc:userA"),
+            author=_USER_A_AUTHOR,
         )
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts(limit=10)
 
-        # Verify second image
-        image2_data = result["images"][1]
-        assert image2_data["alt"] == ""
-        assert "image" in image2_data
-        blob2_data = image2_data["image"]
-        assert blob2_data["mime_type"] == "image/jpeg"
-        assert blob2_data["size"] == 730298
-        assert "ref" in blob2_data
-        assert (
-            blob2_data["ref"]["$link"]
-            == "bafkreignydqmw2pqgm7jo3g4jnuu6ztr53fy26llwoul2gtkd6n7xkvvce"
+    # Quote post should be filtered out
+    assert len(result.posts) == 0
+    assert result.filtered_quotes == 1
+    assert result.total_retrieved == 1
+
+
+def test_allow_self_quote_posts(bluesky_client, atproto_mock, make_feed_item):
+    """Test that quote posts of own content are allowed (self-quotes)"""
+    atproto_mock.me = SimpleNamespace(did="did:plc:userA")
+
+    # Quote post embed (quoting own post)
+    embed = SimpleNamespace(
+        py_type="app.bsky.embed.record",
+        record=SimpleNamespace(uri=_post_uri("original123", "did:plc:userA")),
+    )
+    atproto_mock.get_author_feed.return_value.feed = [
+        make_feed_item(
+            text="Adding more context to my previous post",
+            embed=embed,
+            uri=_post_uri("12345", "did:plc:userA"),
+            author=_USER_A_AUTHOR,
         )
+    ]
 
-        # Verify record is also preserved
-        assert "record" in result
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_extract_self_labels_from_post(self, mock_client_class):
-        """Test extraction of self-labels from post records"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record with self-labels
-        mock_labels = Mock()
-        mock_labels.values = [Mock(val="porn"), Mock(val="nudity")]
-
-        mock_post_record = Mock()
-        mock_post_record.text = "Test post with labels"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = mock_labels
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.self_labels == ["porn", "nudity"]
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_extract_single_self_label(self, mock_client_class):
-        """Test extraction of a single self-label"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record with single self-label
-        mock_labels = Mock()
-        mock_labels.values = [Mock(val="graphic-media")]
-
-        mock_post_record = Mock()
-        mock_post_record.text = "Test post with single label"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = mock_labels
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.self_labels == ["graphic-media"]
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_post_without_self_labels(self, mock_client_class):
-        """Test that posts without labels have None for self_labels"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record without self-labels
-        mock_post_record = Mock()
-        mock_post_record.text = "Test post without labels"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        # Explicitly set labels to None to indicate no labels
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.self_labels is None
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_extract_language_tags_single(self, mock_client_class):
-        """Test extraction of single language tag from post"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record with single language tag
-        mock_post_record = Mock()
-        mock_post_record.text = "Test post in English"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = None
-        mock_post_record.langs = ["en"]
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.langs == ["en"]
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_extract_language_tags_multiple(self, mock_client_class):
-        """Test extraction of multiple language tags from post"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record with multiple language tags
-        mock_post_record = Mock()
-        mock_post_record.text = "Bilingual post / Post bilingüe"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = None
-        mock_post_record.langs = ["en", "es"]
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.langs == ["en", "es"]
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_post_without_language_tags(self, mock_client_class):
-        """Test that posts without language tags have None for langs"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:test123"
-        mock_client.me = mock_me
-
-        # Mock post record without language tags
-        mock_post_record = Mock()
-        mock_post_record.text = "Post without language metadata"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.facets = []
-        mock_post_record.embed = None
-        mock_post_record.reply = None
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:test123/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "test.bsky.social"
-        mock_feed_item.post.author.display_name = "Test User"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("test.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        assert len(result.posts) == 1
-        post = result.posts[0]
-        assert post.langs is None
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_filter_quote_posts_of_others(self, mock_client_class):
-        """Test that quote posts of other people's content are filtered out"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:userA"
-        mock_client.me = mock_me
-
-        # Create a quote post of someone else's content
-        mock_post_record = Mock()
-        mock_post_record.text = "Check this out!"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.reply = None
-        mock_post_record.facets = []
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        # Add quote post embed (quoting someone else's post)
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.record"
-        mock_embed_record = Mock()
-        mock_embed_record.uri = "at://did:plc:userB/app.bsky.feed.post/quoted123"
-        mock_embed.record = mock_embed_record
-        mock_post_record.embed = mock_embed
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:userA/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "userA.bsky.social"
-        mock_feed_item.post.author.display_name = "User A"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("userA.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        # Quote post should be filtered out
-        assert len(result.posts) == 0
-        assert result.filtered_quotes == 1
-        assert result.total_retrieved == 1
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_allow_self_quote_posts(self, mock_client_class):
-        """Test that quote posts of own content are allowed (self-quotes)"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:userA"
-        mock_client.me = mock_me
-
-        # Create a self-quote post (quoting own content)
-        mock_post_record = Mock()
-        mock_post_record.text = "Adding more context to my previous post"
-        mock_post_record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post_record.reply = None
-        mock_post_record.facets = []
-        mock_post_record.labels = None
-        mock_post_record.langs = None
-
-        # Add quote post embed (quoting own post)
-        mock_embed = Mock()
-        mock_embed.py_type = "app.bsky.embed.record"
-        mock_embed_record = Mock()
-        mock_embed_record.uri = "at://did:plc:userA/app.bsky.feed.post/original123"
-        mock_embed.record = mock_embed_record
-        mock_post_record.embed = mock_embed
-
-        mock_feed_item = Mock()
-        if hasattr(mock_feed_item, "reason"):
-            delattr(mock_feed_item, "reason")
-
-        mock_feed_item.post = Mock()
-        mock_feed_item.post.uri = "at://did:plc:userA/app.bsky.feed.post/12345"
-        mock_feed_item.post.cid = "test-cid"
-        mock_feed_item.post.record = mock_post_record
-        mock_feed_item.post.author = Mock()
-        mock_feed_item.post.author.handle = "userA.bsky.social"
-        mock_feed_item.post.author.display_name = "User A"
-
-        mock_response = Mock()
-        mock_response.feed = [mock_feed_item]
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("userA.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        # Self-quote should be included
-        assert len(result.posts) == 1
-        assert result.filtered_quotes == 0
-        assert result.total_retrieved == 1
-        assert result.posts[0].text == "Adding more context to my previous post"
-
-    @patch("src.bluesky_client.AtprotoClient")
-    def test_quote_post_filtering_statistics(self, mock_client_class):
-        """Test that filtered_quotes count is accurate with multiple posts"""
-        mock_client = Mock()
-        mock_me = Mock()
-        mock_me.did = "did:plc:userA"
-        mock_client.me = mock_me
-
-        # Create 3 posts: 1 regular, 1 quote of other, 1 self-quote
-        feed_items = []
+    bluesky_client._authenticated = True
 
-        # Post 1: Regular post (should be included)
-        mock_post1 = Mock()
-        mock_post1.record = Mock()
-        mock_post1.record.text = "Regular post"
-        mock_post1.record.created_at = "2025-01-01T10:00:00.000Z"
-        mock_post1.record.reply = None
-        mock_post1.record.facets = []
-        mock_post1.record.labels = None
-        mock_post1.record.langs = None
-        mock_post1.record.embed = None
-        mock_post1.uri = "at://did:plc:userA/app.bsky.feed.post/post1"
-        mock_post1.cid = "cid1"
-        mock_post1.author = Mock()
-        mock_post1.author.handle = "userA.bsky.social"
-        mock_post1.author.display_name = "User A"
-
-        mock_item1 = Mock()
-        if hasattr(mock_item1, "reason"):
-            delattr(mock_item1, "reason")
-        mock_item1.post = mock_post1
-        feed_items.append(mock_item1)
+    result = bluesky_client.get_recent_posts(limit=10)
+
+    # Self-quote should be included
+    assert len(result.posts) == 1
+    assert result.filtered_quotes == 0
+    assert result.total_retrieved == 1
+    assert result.posts[0].text == "Adding more context to my previous post"
 
-        # Post 2: Quote of someone else (should be filtered)
-        mock_post2 = Mock()
-        mock_post2.record = Mock()
-        mock_post2.record.text = "Quoting someone else"
-        mock_post2.record.created_at = "2025-01-01T11:00:00.000Z"
-        mock_post2.record.reply = None
-        mock_post2.record.facets = []
-        mock_post2.record.labels = None
-        mock_post2.record.langs = None
-        mock_embed2 = Mock()
-        mock_embed2.py_type = "app.bsky.embed.record"
-        mock_embed2.record = Mock()
-        mock_embed2.record.uri = "at://did:plc:userB/app.bsky.feed.post/quoted"
-        mock_post2.record.embed = mock_embed2
-        mock_post2.uri = "at://did:plc:userA/app.bsky.feed.post/post2"
-        mock_post2.cid = "cid2"
-        mock_post2.author = Mock()
-        mock_post2.author.handle = "userA.bsky.social"
-        mock_post2.author.display_name = "User A"
-
-        mock_item2 = Mock()
-        if hasattr(mock_item2, "reason"):
-            delattr(mock_item2, "reason")
-        mock_item2.post = mock_post2
-        feed_items.append(mock_item2)
 
+def test_quote_post_filtering_statistics(bluesky_client, atproto_mock, make_feed_item):
+    """Test that filtered_quotes count is accurate with multiple posts"""
+    atproto_mock.me = SimpleNamespace(did="did:plc:userA")
+
+    def quote_of(uri):
+        return SimpleNamespace(
+            py_type="app.bsky.embed.record", record=SimpleNamespace(uri=uri)
+        )
+
+    # Create 3 posts: 1 regular, 1 quote of other, 1 self-quote
+    atproto_mock.get_author_feed.return_value.feed = [
+        # Post 1: Regular post (should be included)
+        make_feed_item(
+            text="Regular post",
+            created_at=_POST_DATE_NEW,
+            uri=_post_uri("post1", "did:plc:userA"),
+            cid="cid1",
+            author=_USER_A_AUTHOR,
+        ),
+        # Post 2: Quote of someone else (should be filtered)
+        make_feed_item(
+            text="Quoting someone else",
+            created_at="2025-01-01T11:00:00.000Z",
+            embed=quote_of(_post_uri("quoted", "did:plc:userB")),
+            uri=_post_uri("post2", "did:plc:userA"),
+            cid="cid2",
+            author=_USER_A_AUTHOR,
+        ),
         # Post 3: Self-quote (should be included)
-        mock_post3 = Mock()
-        mock_post3.record = Mock()
-        mock_post3.record.text = "Quoting myself"
-        mock_post3.record.created_at = "2025-01-01T12:00:00.000Z"
-        mock_post3.record.reply = None
-        mock_post3.record.facets = []
-        mock_post3.record.labels = None
-        mock_post3.record.langs = None
-        mock_embed3 = Mock()
-        mock_embed3.py_type = "app.bsky.embed.record"
-        mock_embed3.record = Mock()
-        mock_embed3.record.uri = "at://did:plc:userA/app.bsky.feed.post/original"
-        mock_post3.record.embed = mock_embed3
-        mock_post3.uri = "at://did:plc:userA/app.bsky.feed.post/post3"
-        mock_post3.cid = "cid3"
-        mock_post3.author = Mock()
-        mock_post3.author.handle = "userA.bsky.social"
-        mock_post3.author.display_name = "User A"
-
-        mock_item3 = Mock()
-        if hasattr(mock_item3, "reason"):
-            delattr(mock_item3, "reason")
-        mock_item3.post = mock_post3
-        feed_items.append(mock_item3)
-
-        mock_response = Mock()
-        mock_response.feed = feed_items
-        mock_client.get_author_feed.return_value = mock_response
-        mock_client_class.return_value = mock_client
-
-        client = BlueskyClient("userA.bsky.social", "test-password")
-        client._authenticated = True
-
-        result = client.get_recent_posts(limit=10)
-
-        # Should include regular post and self-quote, filter other's quote
-        assert len(result.posts) == 2
-        assert result.filtered_quotes == 1
-        assert result.total_retrieved == 3
-        assert result.posts[0].text == "Regular post"
-        assert result.posts[1].text == "Quoting myself"
+        make_feed_item(
+            text="Quoting myself",
+            created_at="2025-01-01T12:00:00.000Z",
+            embed=quote_of(_post_uri("original", "did:plc:userA")),
+            uri=_post_uri("post3", "did:plc:userA"),
+            cid="cid3",
+            author=_USER_A_AUTHOR,
+        ),
+    ]
+
+    bluesky_client._authenticated = True
+
+    result = bluesky_client.get_recent_posts(limit=10)
+
+    # Should include regular post and self-quote, filter other's quote
+    assert len(result.posts) == 2
+    assert result.filtered_quotes == 1
+    assert result.total_retrieved == 3
+    assert result.posts[0].text == "Regular post"
+    assert result.posts[1].text == "Quoting myself"
@@ -3,134 +3,159 @@ Additional tests for Bluesky Client module to improve coverage
 """
 
 from datetime import datetime, timezone
-from unittest.mock import Mock, PropertyMock, patch
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import Mock, PropertyMock
 
 import pytest
 
-from src.bluesky_client import BlueskyClient, BlueskyFetchResult, BlueskyPost
+from src import bluesky_client as bluesky_module
+from src.bluesky_client import BlueskyFetchResult, BlueskyPost
+
+# Fixed "current" time; tests only need it to be later than their since_date
+_NOW = datetime.now(timezone.utc)
+# Stand-in for feed-item fields the client only checks for presence
+_PRESENT = object()
+
+
+@pytest.fixture(scope="module")
+def filtering_feed():
+    """Author feed with one old post, one reply, one repost and one valid post"""
+    # Create different types of posts for filtering
+    old_post = create_mock_post(
+        uri="at://did:plc:user123/app.bsky.feed.post/old",
+        created_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        is_reply=False,
+        is_repost=False,
+    )
+
+    reply_post = create_mock_post(
+        uri="at://did:plc:user123/app.bsky.feed.post/reply",
+        is_reply=True,
+        is_repost=False,
+    )
+
+    valid_post = create_mock_post(
+        uri="at://did:plc:user123/app.bsky.feed.post/valid",
+        is_reply=False,
+        is_repost=False,
+    )
+
+    return SimpleNamespace(
+        feed=[
+            SimpleNamespace(post=old_post, reply=None, reason=None),
+            # Has reply object
+            SimpleNamespace(post=reply_post, reply=_PRESENT, reason=None),
+            # Has reason (repost)
+            SimpleNamespace(post=valid_post, reply=None, reason=_PRESENT),
+            # Valid post
+            SimpleNamespace(post=valid_post, reply=None, reason=None),
+        ]
+    )
 
 
 class TestBlueskyClientEdgeCases:
     """Additional tests for BlueskyClient edge cases to improve coverage"""
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.client = BlueskyClient("test.bsky.social", "test-password")
-
-    def test_authentication_failure_scenarios(self):
-        """Test various authentication failure scenarios"""
-        with patch.object(self.client.client, "login") as mock_login:
-            # Test network error during authentication
-            mock_login.side_effect = Exception("Network error")
-
-            result = self.client.authenticate()
-            assert result is False
-            assert self.client._authenticated is False
-
-    def test_authentication_success_scenario(self):
-        """Test successful authentication scenario"""
-        with patch.object(self.client.client, "login") as mock_login:
-            # Mock successful authentication
-            mock_profile = Mock()
-            mock_profile.display_name = "Test User"
-            mock_profile.handle = "test.bsky.social"
-            mock_login.return_value = mock_profile
-
-            result = self.client.authenticate()
-            assert result is True
-            assert self.client._authenticated is True
-
-    def test_get_user_did_without_authentication(self):
+    @pytest.fixture(autouse=True)
+    def _use_bluesky_client(self, bluesky_client):
+        """Run every test against the shared, AT Protocol-mocked client fixture"""
+        self.client = bluesky_client
+
+    @pytest.fixture
+    def authed_client(self, bluesky_client, monkeypatch):
+        """The shared client, treated as logged in without calling the API"""
+        bluesky_client._authenticated = True
+        monkeypatch.setattr(bluesky_client, "authenticate", lambda: True)
+        return bluesky_client
+
+    def test_get_user_did_without_authentication(self, monkeypatch):
         """Test get_user_did when not authenticated"""
         # Mock authentication failure
-        with patch.object(self.client, "authenticate", return_value=False):
-            user_did = self.client.get_user_did()
-            assert user_did is None
-
-    def test_get_user_did_with_authentication_success(self):
-        """Test get_user_did with successful authentication"""
-        with patch.object(self.client, "authenticate", return_value=True):
-            # Mock client.me
-            mock_me = Mock()
-            mock_me.did = "did:plc:test123"
-            self.client.client.me = mock_me
-            self.client._authenticated = True
-
-            user_did = self.client.get_user_did()
-            assert user_did == "did:plc:test123"
-
-    def test_get_user_did_with_missing_did(self):
-        """Test get_user_did when client.me has no DID"""
-        with patch.object(self.client, "authenticate", return_value=True):
-            # Mock client.me without DID
-            self.client.client.me = None
-            self.client._authenticated = True
-
-            user_did = self.client.get_user_did()
-            assert user_did is None
-
-    def test_get_user_did_with_exception(self):
+        monkeypatch.setattr(self.client, "authenticate", lambda: False)
+
+        user_did = self.client.get_user_did()
+        assert user_did is None
+
+    @pytest.mark.parametrize(
+        "me,expected_did",
+        [
+            pytest.param(
+                SimpleNamespace(did="did:plc:test123"), "did:plc:test123", id="has-did"
+            ),
+            pytest.param(SimpleNamespace(did=""), None, id="empty-did"),
+            pytest.param(None, None, id="no-session"),
+        ],
+    )
+    def test_get_user_did_from_session(self, authed_client, me, expected_did):
+        """Test get_user_did reads the DID of client.me, if there is one"""
+        authed_client.client.me = me
+
+        user_did = authed_client.get_user_did()
+        assert user_did == expected_did
+
+    def test_get_user_did_with_exception(self, authed_client, monkeypatch):
         """Test get_user_did when an exception occurs"""
-        with patch.object(self.client, "authenticate", return_value=True):
-            self.client._authenticated = True
-            # Mock an exception when accessing client.me property
-            mock_client = Mock()
-            # Configure the mock to raise an exception when .me is accessed
-            type(mock_client).me = PropertyMock(side_effect=Exception("API error"))
-            self.client.client = mock_client
-
-            user_did = self.client.get_user_did()
-            assert user_did is None
-
-    @patch("src.bluesky_client.requests.get")
-    def test_download_blob_network_error(self, mock_get):
+        # Mock an exception when accessing client.me property
+        mock_client = Mock()
+        # Configure the mock to raise an exception when .me is accessed
+        type(mock_client).me = PropertyMock(side_effect=Exception("API error"))
+        monkeypatch.setattr(authed_client, "client", mock_client)
+
+        user_did = authed_client.get_user_did()
+        assert user_did is None
+
+    def test_download_blob_network_error(self, authed_client, monkeypatch):
         """Test download_blob with network error"""
-        mock_get.side_effect = Exception("Network error")
 
-        result = self.client.download_blob("blob_reference", "did:plc:test123")
+        def fail(*args, **kwargs):
+            raise Exception("Network error")
+
+        monkeypatch.setattr(bluesky_module, "requests", SimpleNamespace(get=fail))
+
+        result = authed_client.download_blob("blob_reference", "did:plc:test123")
         assert result is None
 
-    @patch("src.bluesky_client.requests.get")
-    def test_download_blob_http_error(self, mock_get):
+    def test_download_blob_http_error(self, authed_client, monkeypatch):
         """Test download_blob with HTTP error"""
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = Exception("HTTP 404")
-        mock_get.return_value = mock_response
 
-        result = self.client.download_blob("blob_reference", "did:plc:test123")
+        def raise_for_status():
+            raise Exception("HTTP 404")
+
+        response = SimpleNamespace(raise_for_status=raise_for_status)
+        monkeypatch.setattr(
+            bluesky_module,
+            "requests",
+            SimpleNamespace(get=lambda *args, **kwargs: response),
+        )
+
+        result = authed_client.download_blob("blob_reference", "did:plc:test123")
         assert result is None
 
-    @patch("src.bluesky_client.requests.get")
-    def test_download_blob_success(self, mock_get):
-        """Test successful blob download"""
-        mock_response = Mock()
-        mock_response.content = b"blob data"
-        mock_response.headers = {"content-type": "image/jpeg"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    def test_download_blob_not_authenticated(self, monkeypatch):
+        """Test download_blob refuses to fetch anything without a session"""
 
-        # Mock authenticated client
-        self.client._authenticated = True
-        self.client.client.me = Mock()
-        self.client.client.me.did = "did:plc:test"
+        get = Mock()
+        monkeypatch.setattr(bluesky_module, "requests", SimpleNamespace(get=get))
 
         result = self.client.download_blob("blob_reference", "did:plc:test123")
-        assert result == (b"blob data", "image/jpeg")
+        assert result is None
+        get.assert_not_called()
 
-    def test_extract_did_from_uri_various_formats(self):
-        """Test _extract_did_from_uri with various URI formats"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "uri,expected_did",
+        [
             ("at://did:plc:abc123/app.bsky.feed.post/xyz", "did:plc:abc123"),
             ("at://did:web:example.com/app.bsky.feed.post/123", "did:web:example.com"),
             ("at://invalid-did-format/path", None),  # Invalid format
             ("invalid-uri", None),  # Not an AT URI
             ("", None),  # Empty string
             ("at://", None),  # Incomplete URI
-        ]
-
-        for uri, expected_did in test_cases:
-            result = self.client._extract_did_from_uri(uri)
-            assert result == expected_did
+        ],
+    )
+    def test_extract_did_from_uri_various_formats(self, uri, expected_did):
+        """Test _extract_did_from_uri with various URI formats"""
+        assert self.client._extract_did_from_uri(uri) == expected_did
 
     def test_get_recent_posts_not_authenticated(self):
         """Test get_recent_posts when not authenticated"""
@@ -139,301 +164,166 @@ class TestBlueskyClientEdgeCases:
 
         assert "not authenticated" in str(exc_info.value)
 
-    def test_get_recent_posts_authentication_failure(self):
-        """Test get_recent_posts raises RuntimeError when client was never authenticated"""
-        with pytest.raises(RuntimeError) as exc_info:
-            self.client.get_recent_posts(limit=10)
+    def test_get_recent_posts_with_filtering(
+        self, authed_client, monkeypatch, filtering_feed
+    ):
+        """Test get_recent_posts with various filtering scenarios"""
+        authed_client.client.me = SimpleNamespace(did="did:plc:user123")
 
-        assert "not authenticated" in str(exc_info.value)
+        monkeypatch.setattr(
+            authed_client.client, "get_author_feed", lambda **kwargs: filtering_feed
+        )
+
+        since_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
+        result = authed_client.get_recent_posts(limit=10, since_date=since_date)
+
+        assert isinstance(result, BlueskyFetchResult)
+        assert result.total_retrieved == 4
+        # Verify exact filtering counts: 1 old post, 1 reply, 1 repost, 1 included
+        assert result.filtered_by_date == 1
+        assert result.filtered_replies == 1
+        assert result.filtered_reposts == 1
+        assert result.filtered_quotes == 0
+        assert len(result.posts) == 1
+
+    def test_get_recent_posts_without_user_did(
+        self, authed_client, monkeypatch, filtering_feed, caplog
+    ):
+        """Test get_recent_posts warns but still fetches when the DID is unknown"""
+        authed_client.client.me = None
+
+        monkeypatch.setattr(
+            authed_client.client, "get_author_feed", lambda **kwargs: filtering_feed
+        )
 
-    def test_get_recent_posts_api_exception(self):
-        """Test get_recent_posts when API call throws exception"""
-        # Mock successful authentication
-        with patch.object(self.client, "authenticate", return_value=True):
-            self.client._authenticated = True
+        result = authed_client.get_recent_posts(limit=10)
 
-            # Mock API call to throw exception
-            with patch.object(
-                self.client.client,
-                "get_author_feed",
-                side_effect=Exception("API error"),
-            ):
-                result = self.client.get_recent_posts(limit=10)
+        assert result.total_retrieved == 4
+        assert "Could not get user DID for self-reply detection" in caplog.text
 
-                assert isinstance(result, BlueskyFetchResult)
-                assert len(result.posts) == 0
+    def test_get_post_thread_ignores_non_dict_thread(self, atproto_mock):
+        """Test get_post_thread returns None when the thread is not a plain dict"""
+        # get_post_thread does not require a session; it always queries the API
+        atproto_mock.get_post_thread.return_value = SimpleNamespace(
+            thread=SimpleNamespace(post=SimpleNamespace(uri="at://test/post/123"))
+        )
 
-    def test_get_recent_posts_with_filtering(self):
-        """Test get_recent_posts with various filtering scenarios"""
-        # Mock successful authentication
-        with patch.object(self.client, "authenticate", return_value=True):
-            self.client._authenticated = True
-            self.client.client.me = Mock()
-            self.client.client.me.did = "did:plc:user123"
-
-            # Create mock feed data with various post types
-            mock_feed = Mock()
-
-            # Create different types of posts for filtering
-            old_post = create_mock_post(
-                uri="at://did:plc:user123/app.bsky.feed.post/old",
-                created_at=datetime(2020, 1, 1, tzinfo=timezone.utc),
-                is_reply=False,
-                is_repost=False,
-            )
-
-            reply_post = create_mock_post(
-                uri="at://did:plc:user123/app.bsky.feed.post/reply",
-                created_at=datetime.now(timezone.utc),
-                is_reply=True,
-                is_repost=False,
-            )
-
-            valid_post = create_mock_post(
-                uri="at://did:plc:user123/app.bsky.feed.post/valid",
-                created_at=datetime.now(timezone.utc),
-                is_reply=False,
-                is_repost=False,
-            )
-
-            mock_feed.feed = [
-                Mock(post=old_post, reply=None, reason=None),
-                Mock(post=reply_post, reply=Mock(), reason=None),  # Has reply object
-                Mock(post=valid_post, reply=None, reason=Mock()),  # Has reason (repost)
-                Mock(post=valid_post, reply=None, reason=None),  # Valid post
-            ]
-
-            with patch.object(
-                self.client.client, "get_author_feed", return_value=mock_feed
-            ):
-                since_date = datetime(2023, 1, 1, tzinfo=timezone.utc)
-                result = self.client.get_recent_posts(limit=10, since_date=since_date)
-
-                assert isinstance(result, BlueskyFetchResult)
-                assert result.total_retrieved == 4
-                # Verify exact filtering counts: 1 old post, 1 reply, 1 repost, 1 included
-                assert result.filtered_by_date == 1
-                assert result.filtered_replies == 1
-                assert result.filtered_reposts == 1
-                assert result.filtered_quotes == 0
-                assert len(result.posts) == 1
-
-    def test_get_post_thread_not_authenticated(self):
-        """Test get_post_thread when not authenticated"""
         result = self.client.get_post_thread("at://test/post/123")
-        assert result is None
 
-    def test_get_post_thread_authentication_failure(self):
-        """Test get_post_thread when authentication fails"""
-        with patch.object(self.client, "authenticate", return_value=False):
-            result = self.client.get_post_thread("at://test/post/123")
-            assert result is None
-
-    def test_get_post_thread_api_exception(self):
-        """Test get_post_thread when API call throws exception"""
-        with patch.object(self.client, "authenticate", return_value=True):
-            self.client._authenticated = True
-
-            with patch.object(
-                self.client.client,
-                "get_post_thread",
-                side_effect=Exception("API error"),
-            ):
-                result = self.client.get_post_thread("at://test/post/123")
-                assert result is None
-
-    def test_get_post_thread_success(self):
-        """Test successful get_post_thread"""
-        with patch.object(self.client, "authenticate", return_value=True):
-            self.client._authenticated = True
-
-            # Mock successful thread response
-            mock_response = Mock()
-            mock_thread = {"thread": {"post": {"uri": "at://test/post/123"}}}
-            mock_response.thread = mock_thread
-
-            with patch.object(
-                self.client.client, "get_post_thread", return_value=mock_response
-            ):
-                result = self.client.get_post_thread("at://test/post/123")
-
-                assert result is not None
-                assert isinstance(result, dict)
-                assert "thread" in result
-
-
-def create_mock_post(uri, created_at, is_reply=False, is_repost=False):
-    """Helper function to create mock post objects"""
-    mock_post = Mock()
-    mock_post.uri = uri
-    mock_post.cid = "test_cid"
+        assert result is None
+        atproto_mock.get_post_thread.assert_called_once_with(uri="at://test/post/123")
 
-    # Mock record
-    mock_record = Mock()
-    mock_record.text = "Test post content"
-    mock_record.created_at = created_at.isoformat()
 
+def create_mock_post(uri, created_at=_NOW, is_reply=False, is_repost=False):
+    """Helper function to create mock post objects"""
+    reply = None
     if is_reply:
-        mock_record.reply = Mock()
-        mock_record.reply.parent = Mock()
-        mock_record.reply.parent.uri = (
-            "at://did:plc:otheruser/app.bsky.feed.post/parent"
+        # Both root and parent are needed for reply detection
+        reply = SimpleNamespace(
+            parent=SimpleNamespace(
+                uri="at://did:plc:otheruser/app.bsky.feed.post/parent"
+            ),
+            root=SimpleNamespace(uri="at://did:plc:otheruser/app.bsky.feed.post/root"),
         )
-        # Add root attribute for reply detection
-        mock_record.reply.root = Mock()
-        mock_record.reply.root.uri = "at://did:plc:otheruser/app.bsky.feed.post/root"
-    else:
-        mock_record.reply = None
-
-    mock_record.embed = None
-    mock_record.facets = None
-    mock_record.labels = None  # Add labels attribute
-    mock_record.langs = None  # Add langs attribute
-
-    mock_post.record = mock_record
 
-    # Mock author
-    mock_author = Mock()
-    mock_author.handle = "test.bsky.social"
-    mock_author.display_name = "Test User"
-    mock_post.author = mock_author
-
-    return mock_post
+    record = SimpleNamespace(
+        text="Test post content",
+        created_at=created_at.isoformat(),
+        reply=reply,
+        embed=None,
+        facets=None,
+        labels=None,
+        langs=None,
+    )
+    author = SimpleNamespace(handle="test.bsky.social", display_name="Test User")
+
+    return SimpleNamespace(uri=uri, cid="test_cid", record=record, author=author)
+
+
+_MINIMAL_POST_KWARGS: Dict[str, Any] = {
+    "uri": "at://test/post/123",
+    "cid": "test_cid",
+    "text": "Test post",
+    "created_at": _NOW,
+    "author_handle": "test.bsky.social",
+}
+_POST_OPTIONAL_DEFAULTS: Dict[str, Any] = {
+    "author_display_name": None,
+    "reply_to": None,
+    "embed": None,
+    "facets": None,
+    "self_labels": None,
+    "langs": None,
+}
+_EMPTY_FETCH_RESULT_KWARGS: Dict[str, Any] = {
+    "posts": [],
+    "total_retrieved": 0,
+    "filtered_replies": 0,
+    "filtered_reposts": 0,
+    "filtered_by_date": 0,
+}
 
 
 class TestBlueskyDataClasses:
     """Test the Bluesky dataclasses"""
 
-    def test_bluesky_post_creation(self):
-        """Test BlueskyPost dataclass creation"""
-        now = datetime.now(timezone.utc)
-
-        post = BlueskyPost(
-            uri="at://test/post/123",
-            cid="test_cid",
-            text="Test post",
-            created_at=now,
-            author_handle="test.bsky.social",
-            author_display_name="Test User",
-            reply_to="at://parent/post/456",
-            embed={"type": "external", "uri": "https://example.com"},
-            facets=[{"type": "link"}],
-        )
-
-        assert post.uri == "at://test/post/123"
-        assert post.cid == "test_cid"
-        assert post.text == "Test post"
-        assert post.created_at == now
-        assert post.author_handle == "test.bsky.social"
-        assert post.author_display_name == "Test User"
-        assert post.reply_to == "at://parent/post/456"
-        assert post.embed is not None
-        assert post.facets is not None
-
-    def test_bluesky_post_minimal_creation(self):
-        """Test BlueskyPost creation with minimal required fields"""
-        now = datetime.now(timezone.utc)
-
-        post = BlueskyPost(
-            uri="at://test/post/123",
-            cid="test_cid",
-            text="Test post",
-            created_at=now,
-            author_handle="test.bsky.social",
-        )
-
-        assert post.uri == "at://test/post/123"
-        assert post.author_display_name is None
-        assert post.reply_to is None
-        assert post.embed is None
-        assert post.facets is None
-
-    def test_bluesky_fetch_result_creation(self):
-        """Test BlueskyFetchResult dataclass creation"""
-        posts = [
-            BlueskyPost(
-                uri="at://test/post/1",
-                cid="cid1",
-                text="Post 1",
-                created_at=datetime.now(timezone.utc),
-                author_handle="user1.bsky.social",
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(_MINIMAL_POST_KWARGS, id="minimal"),
+            pytest.param(
+                {
+                    **_MINIMAL_POST_KWARGS,
+                    "author_display_name": "Test User",
+                    "reply_to": "at://parent/post/456",
+                    "embed": {"type": "external", "uri": "https://example.com"},
+                    "facets": [{"type": "link"}],
+                    "self_labels": ["nudity"],
+                    "langs": ["en"],
+                },
+                id="all-fields",
             ),
-            BlueskyPost(
-                uri="at://test/post/2",
-                cid="cid2",
-                text="Post 2",
-                created_at=datetime.now(timezone.utc),
-                author_handle="user2.bsky.social",
+        ],
+    )
+    def test_bluesky_post_fields(self, kwargs):
+        """Test BlueskyPost keeps the given fields and defaults the rest to None"""
+        post = BlueskyPost(**kwargs)
+
+        assert vars(post) == {**_POST_OPTIONAL_DEFAULTS, **kwargs}
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param(_EMPTY_FETCH_RESULT_KWARGS, id="empty"),
+            pytest.param(
+                {
+                    "posts": [
+                        BlueskyPost(**_MINIMAL_POST_KWARGS),
+                        BlueskyPost(
+                            **{**_MINIMAL_POST_KWARGS, "uri": "at://test/post/2"}
+                        ),
+                    ],
+                    "total_retrieved": 10,
+                    "filtered_replies": 3,
+                    "filtered_reposts": 2,
+                    "filtered_by_date": 3,
+                },
+                id="populated",
             ),
-        ]
+        ],
+    )
+    def test_bluesky_fetch_result_fields(self, kwargs):
+        """Test BlueskyFetchResult keeps the given counters and defaults the rest"""
+        result = BlueskyFetchResult(**kwargs)
 
-        result = BlueskyFetchResult(
-            posts=posts,
-            total_retrieved=10,
-            filtered_replies=3,
-            filtered_reposts=2,
-            filtered_by_date=3,
-        )
-
-        assert len(result.posts) == 2
-        assert result.total_retrieved == 10
-        assert result.filtered_replies == 3
-        assert result.filtered_reposts == 2
-        assert result.filtered_by_date == 3
-
-        # Test that filtering stats add up correctly
-        total_filtered = (
-            result.filtered_replies + result.filtered_reposts + result.filtered_by_date
-        )
-        expected_remaining = result.total_retrieved - total_filtered
-        assert len(result.posts) <= expected_remaining
-
-    def test_bluesky_fetch_result_empty(self):
-        """Test BlueskyFetchResult with empty results"""
-        result = BlueskyFetchResult(
-            posts=[],
-            total_retrieved=0,
-            filtered_replies=0,
-            filtered_reposts=0,
-            filtered_by_date=0,
-        )
-
-        assert len(result.posts) == 0
-        assert result.total_retrieved == 0
-        assert result.filtered_replies == 0
-        assert result.filtered_reposts == 0
-        assert result.filtered_by_date == 0
-
-    def test_bluesky_fetch_result_filtered_posts_default(self):
-        """Test that filtered_posts defaults to an empty dict (not None) when omitted"""
-        result = BlueskyFetchResult(
-            posts=[],
-            total_retrieved=0,
-            filtered_replies=0,
-            filtered_reposts=0,
-            filtered_by_date=0,
-        )
-
-        # Must be an empty dict, never None, so callers can call .items() safely
-        assert result.filtered_posts == {}
-        assert isinstance(result.filtered_posts, dict)
+        # filtered_posts must be an empty dict, never None, so callers can call
+        # .items() safely
+        assert vars(result) == {"filtered_quotes": 0, "filtered_posts": {}, **kwargs}
 
     def test_bluesky_fetch_result_filtered_posts_are_per_instance(self):
         """Test that each BlueskyFetchResult instance gets its own filtered_posts dict"""
-        result_a = BlueskyFetchResult(
-            posts=[],
-            total_retrieved=0,
-            filtered_replies=0,
-            filtered_reposts=0,
-            filtered_by_date=0,
-        )
-        result_b = BlueskyFetchResult(
-            posts=[],
-            total_retrieved=0,
-            filtered_replies=0,
-            filtered_reposts=0,
-            filtered_by_date=0,
-        )
+        result_a = BlueskyFetchResult(**_EMPTY_FETCH_RESULT_KWARGS)
+        result_b = BlueskyFetchResult(**_EMPTY_FETCH_RESULT_KWARGS)
 
         result_a.filtered_posts["at://user/post/1"] = "reply-not-self-threaded"
 
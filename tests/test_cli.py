@@ -7,367 +7,264 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
 from click.testing import CliRunner
 from sync import ENV_TEMPLATE, _cli_name, cli
 
+from src.config import Settings
+from src.sync_orchestrator import SocialSyncOrchestrator
+
+# Keys a usable .env must define
+_CREDENTIAL_KEYS = [
+    "BLUESKY_HANDLE",
+    "BLUESKY_PASSWORD",
+    "MASTODON_API_BASE_URL",
+    "MASTODON_ACCESS_TOKEN",
+]
+
+# Environment variables the sync command exports for the orchestrator to read
+_SYNC_ENV_OVERRIDES = ("DRY_RUN", "SYNC_START_DATE", "DISABLE_SOURCE_PLATFORM")
+
+
+def _assert_contains_all(text, needles):
+    """Assert every needle occurs in text, reporting all that are missing"""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing: {missing}"
+
+
+@pytest.fixture(autouse=True)
+def _restore_sync_env(monkeypatch):
+    """Start each test without the sync overrides and undo any it sets"""
+    for name in _SYNC_ENV_OVERRIDES:
+        # setenv first so monkeypatch records the original value, even when unset
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+
+@pytest.fixture
+def cli_runner():
+    """Click test runner that invokes the CLI in-process"""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_orchestrator(mocker):
+    """Orchestrator double handed out by the sync, status and test commands"""
+    orchestrator = Mock(spec_set=SocialSyncOrchestrator)
+    orchestrator.run_sync.return_value = {
+        "success": True,
+        "synced_count": 5,
+        "failed_count": 0,
+        "duration": 2.5,
+        "dry_run": False,
+    }
+    # mocker rather than monkeypatch: sync resolves this name lazily, and the
+    # patch must be deleted again at teardown, not pinned onto the module
+    mocker.patch("sync.SocialSyncOrchestrator", return_value=orchestrator)
+    return orchestrator
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        pytest.param(["--help"], ["Social Sync", "Usage:"], id="cli"),
+        pytest.param(
+            ["sync", "--help"],
+            ["--dry-run", "--since-date", "--disable-source-platform"],
+            id="sync",
+        ),
+        pytest.param(["status", "--help"], [], id="status"),
+        pytest.param(["config", "--help"], [], id="config"),
+        pytest.param(["test", "--help"], [], id="test"),
+        # Group options are accepted ahead of --help
+        pytest.param(["--log-level", "DEBUG", "--help"], [], id="log-level"),
+    ],
+)
+def test_cli_help(cli_runner, args, expected):
+    """Test help for the CLI group and each subcommand"""
+    result = cli_runner.invoke(cli, args)
+
+    assert result.exit_code == 0, result.output
+    _assert_contains_all(result.output, expected)
+
+
+def test_sync_command_dry_run(cli_runner, mock_orchestrator):
+    """Test sync command with --dry-run flag"""
+    result = cli_runner.invoke(cli, ["sync", "--dry-run"])
 
-def test_cli_help_command():
-    """Test CLI help command works"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
-    assert "Social Sync" in result.output or "Usage:" in result.output
+    assert result.exit_code == 0, result.output
+    mock_orchestrator.run_sync.assert_called_once()
 
 
-def test_cli_sync_command_help():
-    """Test sync subcommand help"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["sync", "--help"])
-    assert result.exit_code == 0
-    assert "--dry-run" in result.output
-    assert "--since-date" in result.output
-    assert "--disable-source-platform" in result.output
+def test_sync_command_since_date(cli_runner, mock_orchestrator):
+    """Test sync command with --since flag"""
+    result = cli_runner.invoke(cli, ["sync", "--since-date", "2023-01-01"])
 
+    assert result.exit_code == 0, result.output
+    mock_orchestrator.run_sync.assert_called_once()
 
-def test_cli_status_command_help():
-    """Test status subcommand help"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["status", "--help"])
-    assert result.exit_code == 0
 
+def test_sync_command_disable_source_platform(cli_runner, mock_orchestrator):
+    """Test sync command with --disable-source-platform flag"""
+    result = cli_runner.invoke(cli, ["sync", "--disable-source-platform"])
 
-def test_cli_config_command_help():
-    """Test config subcommand help"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["config", "--help"])
-    assert result.exit_code == 0
+    assert result.exit_code == 0, result.output
+    mock_orchestrator.run_sync.assert_called_once()
 
+    # Verify environment variable was set
+    assert os.environ.get("DISABLE_SOURCE_PLATFORM") == "true"
 
-def test_cli_test_command_help():
-    """Test test subcommand help"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["test", "--help"])
-    assert result.exit_code == 0
 
+def test_status_command(cli_runner, mock_orchestrator):
+    """Test status command"""
+    mock_orchestrator.get_sync_status.return_value = {
+        "last_sync_time": "2025-01-01T12:00:00",
+        "total_synced_posts": 10,
+        "dry_run_mode": False,
+    }
 
-def test_sync_command_dry_run():
-    """Test sync command with --dry-run flag"""
-    with (
-        patch("src.sync_orchestrator.SocialSyncOrchestrator") as mock_orchestrator,
-        patch("src.config.Settings") as mock_settings,
-        patch("sync.SocialSyncOrchestrator") as mock_sync_orchestrator_direct,
-    ):
-        # Configure mocks
-        mock_settings_instance = Mock()
-        mock_settings_instance.state_file = "/tmp/test_state.json"  # nosec B108
-        mock_settings.return_value = mock_settings_instance
-
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator.return_value = mock_orchestrator_instance
-
-        # Mock run_sync to return proper dictionary
-        mock_orchestrator_instance.run_sync.return_value = {
-            "success": True,
-            "synced_count": 5,
-            "failed_count": 0,
-            "duration": 2.5,
-            "dry_run": True,
-        }
-
-        # Mock the direct import in sync.py as well
-        mock_sync_orchestrator_direct.return_value = mock_orchestrator_instance
-
-        # Use Click's test runner instead of subprocess
-        runner = CliRunner()
-        result = runner.invoke(cli, ["sync", "--dry-run"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
-
-        # Verify command executed successfully
-        assert result.exit_code == 0
+    result = cli_runner.invoke(cli, ["status"])
 
-        # Verify run_sync was called
-        mock_orchestrator_instance.run_sync.assert_called_once()
+    assert result.exit_code == 0, result.output
+    assert "Sync Status" in result.output
 
 
-def test_sync_command_since_date():
-    """Test sync command with --since flag"""
-    with (
-        patch("src.sync_orchestrator.SocialSyncOrchestrator") as mock_orchestrator,
-        patch("src.config.Settings") as mock_settings,
-        patch("sync.SocialSyncOrchestrator") as mock_sync_orchestrator_direct,
-    ):
-        # Configure mocks
-        mock_settings_instance = Mock()
-        mock_settings_instance.state_file = "/tmp/test_state.json"  # nosec B108
-        mock_settings.return_value = mock_settings_instance
-
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator.return_value = mock_orchestrator_instance
-
-        # Mock run_sync to return proper dictionary
-        mock_orchestrator_instance.run_sync.return_value = {
-            "success": True,
-            "synced_count": 3,
-            "failed_count": 0,
-            "duration": 1.8,
-            "dry_run": False,
-        }
-
-        # Mock the direct import in sync.py as well
-        mock_sync_orchestrator_direct.return_value = mock_orchestrator_instance
-
-        # Use Click's test runner
-        runner = CliRunner()
-        result = runner.invoke(cli, ["sync", "--since-date", "2023-01-01"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
-
-        # Verify command executed successfully
-        assert result.exit_code == 0
+def test_config_command(cli_runner):
+    """Test config command displays settings"""
+    with patch("sync.get_settings") as mock_get_settings:
+        # A real Settings object, so the command can only read fields that exist
+        mock_get_settings.return_value = Settings(
+            _env_file=None,
+            bluesky_handle="test.bsky.social",
+            bluesky_password="test-password",
+            mastodon_api_base_url="https://mastodon.social",
+            mastodon_access_token="test-token",
+            sync_interval_minutes=60,
+            max_posts_per_sync=10,
+            dry_run=False,
+            log_level="INFO",
+        )
+
+        result = cli_runner.invoke(cli, ["config"])
+
+        assert result.exit_code == 0, result.output
+        assert "Configuration" in result.output
 
-        # Verify run_sync was called
-        mock_orchestrator_instance.run_sync.assert_called_once()
 
+def test_test_command_success(cli_runner, mock_orchestrator):
+    """Test test command with successful connections"""
+    mock_orchestrator.setup_clients.return_value = True  # Successful setup
 
-def test_sync_command_disable_source_platform():
-    """Test sync command with --disable-source-platform flag"""
-    with (
-        patch("src.sync_orchestrator.SocialSyncOrchestrator") as mock_orchestrator,
-        patch("src.config.Settings") as mock_settings,
-        patch("sync.SocialSyncOrchestrator") as mock_sync_orchestrator_direct,
-    ):
-        # Configure mocks
-        mock_settings_instance = Mock()
-        mock_settings_instance.state_file = "/tmp/test_state.json"  # nosec B108
-        mock_settings.return_value = mock_settings_instance
-
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator.return_value = mock_orchestrator_instance
-
-        # Mock run_sync to return proper dictionary
-        mock_orchestrator_instance.run_sync.return_value = {
-            "success": True,
-            "synced_count": 5,
-            "failed_count": 0,
-            "duration": 2.0,
-            "dry_run": False,
-        }
-
-        # Mock the direct import in sync.py as well
-        mock_sync_orchestrator_direct.return_value = mock_orchestrator_instance
-
-        # Use Click's test runner
-        runner = CliRunner()
-        result = runner.invoke(cli, ["sync", "--disable-source-platform"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
-
-        # Verify command executed successfully
-        assert result.exit_code == 0
+    result = cli_runner.invoke(cli, ["test"])
 
-        # Verify run_sync was called
-        mock_orchestrator_instance.run_sync.assert_called_once()
+    assert result.exit_code == 0, result.output
+    assert "All clients authenticated successfully!" in result.output
 
-        # Verify environment variable was set
-        import os
 
-        assert os.environ.get("DISABLE_SOURCE_PLATFORM") == "true"
+def test_test_command_failure(cli_runner, mock_orchestrator):
+    """Test test command with failed connections"""
+    # Mock failed client setup
+    mock_orchestrator.setup_clients.return_value = False
 
+    result = cli_runner.invoke(cli, ["test"])
 
-def test_status_command():
-    """Test status command"""
-    with (
-        patch("sync.SocialSyncOrchestrator") as mock_orchestrator_class,
-        patch.dict(
-            os.environ,
-            {
-                "BLUESKY_HANDLE": "test.bsky.social",
-                "BLUESKY_PASSWORD": "test-password",
-                "MASTODON_ACCESS_TOKEN": "test-token",
-            },
-        ),
-    ):
-        mock_orchestrator = Mock()
-        mock_orchestrator.get_sync_status.return_value = {
-            "last_sync_time": "2025-01-01T12:00:00",
-            "total_synced_posts": 10,
-            "dry_run_mode": False,
-        }
-        mock_orchestrator_class.return_value = mock_orchestrator
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["status"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
+    # Verify test command exits with non-zero code on failure
+    assert result.exit_code != 0
 
-        assert result.exit_code == 0
-        assert "Sync Status" in result.output
 
+def test_invalid_command(cli_runner):
+    """Test CLI with invalid command"""
+    result = cli_runner.invoke(cli, ["invalid-command"])
 
-def test_config_command():
-    """Test config command displays settings"""
-    with (
-        patch("sync.get_settings") as mock_get_settings,
-        patch.dict(
-            os.environ,
-            {
-                "BLUESKY_HANDLE": "test.bsky.social",
-                "BLUESKY_PASSWORD": "test-password",
-                "MASTODON_ACCESS_TOKEN": "test-token",
-            },
-        ),
-    ):
-        mock_settings = Mock()
-        mock_settings.bluesky_handle = "test.bsky.social"
-        mock_settings.mastodon_api_base_url = "https://mastodon.social"
-        mock_settings.sync_interval_minutes = 60
-        mock_settings.max_posts_per_sync = 10
-        mock_settings.dry_run = False
-        mock_settings.log_level = "INFO"
-        mock_get_settings.return_value = mock_settings
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["config"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
+    assert result.exit_code != 0
+    assert "No such command" in result.output
 
-        assert result.exit_code == 0
-        assert "Configuration" in result.output
 
+def test_sync_missing_credentials(cli_runner, tmp_path, monkeypatch):
+    """Test sync command fails with missing credentials"""
+    # No .env in the working directory and no credentials in the environment
+    monkeypatch.chdir(tmp_path)
+    for name in list(os.environ):
+        if name.startswith(("BLUESKY_", "MASTODON_")):
+            monkeypatch.delenv(name)
 
-def test_test_command_success():
-    """Test test command with successful connections"""
-    with (
-        patch("src.sync_orchestrator.SocialSyncOrchestrator") as mock_orchestrator,
-        patch("sync.SocialSyncOrchestrator") as mock_sync_orchestrator_direct,
-        patch("src.config.get_settings") as mock_get_settings,
-        patch.dict(
-            os.environ,
-            {
-                "BLUESKY_HANDLE": "test.bsky.social",
-                "BLUESKY_PASSWORD": "test-password",
-                "MASTODON_API_BASE_URL": "https://mastodon.social",
-                "MASTODON_ACCESS_TOKEN": "test-token",
-            },
-        ),
-    ):
-        # Configure settings mocks
-        mock_settings_instance = Mock()
-        mock_settings_instance.state_file = "/tmp/test_state.json"  # nosec B108
-        mock_settings_instance.bluesky_handle = "test.bsky.social"
-        mock_settings_instance.bluesky_password = "test-password"
-        mock_settings_instance.mastodon_api_base_url = "https://mastodon.social"
-        mock_settings_instance.mastodon_access_token = "test-token"
-        mock_get_settings.return_value = mock_settings_instance
-
-        # Configure orchestrator mock
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator_instance.setup_clients.return_value = True  # Successful setup
-        mock_orchestrator.return_value = mock_orchestrator_instance
-        mock_sync_orchestrator_direct.return_value = mock_orchestrator_instance
-
-        # Use Click's test runner
-        runner = CliRunner()
-        result = runner.invoke(cli, ["test"])
-
-        # Print output for debugging
-        if result.exit_code != 0:
-            print(f"Command output: {result.output}")
-            print(f"Exception: {result.exception}")
-
-        # Verify command executed successfully
-        assert result.exit_code == 0
-        assert "All clients authenticated successfully!" in result.output
+    result = cli_runner.invoke(cli, ["sync", "--dry-run"])
 
+    # Verify command fails due to missing credentials
+    assert result.exit_code != 0
+    assert "Configuration file missing" in result.output
 
-def test_test_command_failure():
-    """Test test command with failed connections"""
-    with (
-        patch("sync.SocialSyncOrchestrator") as mock_orchestrator,
-        patch.dict(
-            os.environ,
-            {
-                "BLUESKY_HANDLE": "test.bsky.social",
-                "BLUESKY_PASSWORD": "test-password",
-                "MASTODON_API_BASE_URL": "https://mastodon.social",
-                "MASTODON_ACCESS_TOKEN": "test-token",
-            },
-        ),
-    ):
-        # Mock failed client setup
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator_instance.setup_clients.return_value = False
-        mock_orchestrator.return_value = mock_orchestrator_instance
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["test"])
+def test_sync_invalid_setting_is_not_reported_as_missing_config(
+    cli_runner, tmp_path, monkeypatch, settings_credentials
+):
+    """Test validation errors other than missing credentials propagate unchanged"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MAX_POSTS_PER_SYNC", "not-a-number")
 
-        # Verify test command exits with non-zero code on failure
-        assert result.exit_code != 0
+    result = cli_runner.invoke(cli, ["sync", "--dry-run"])
 
+    assert result.exit_code != 0
+    assert "Unexpected error" in result.output
+    assert "max_posts_per_sync" in result.output
+    assert "Configuration" not in result.output
 
-def test_invalid_command():
-    """Test CLI with invalid command"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["invalid-command"])
 
-    assert result.exit_code != 0
-    assert "No such command" in result.output
+def test_orchestrator_is_resolved_lazily():
+    """sync.SocialSyncOrchestrator resolves to the real class on first access"""
+    import sync
 
+    from src.sync_orchestrator import SocialSyncOrchestrator
+
+    assert "SocialSyncOrchestrator" not in vars(sync)
+    assert sync.SocialSyncOrchestrator is SocialSyncOrchestrator
 
-def test_sync_missing_credentials():
-    """Test sync command fails with missing credentials"""
-    # Use Click's test runner with empty environment
-    runner = CliRunner()
-    with runner.isolated_filesystem():
-        # Clear credential environment variables
-        env = {
-            k: v
-            for k, v in os.environ.items()
-            if not k.startswith(("BLUESKY_", "MASTODON_"))
-        }
 
-        # Mock to prevent actual credential checking
-        with patch("src.config.Settings") as mock_settings:
-            # Configure settings to raise error for missing credentials
-            mock_settings.side_effect = ValueError("Missing required credentials")
+def test_urllib3_warning_filter_registered_once():
+    """Re-importing sync must not register the urllib3 warning filter again"""
+    import importlib
+    import warnings
+
+    import sync
+
+    def matching_filters():
+        return [
+            f
+            for f in warnings.filters
+            if f[1] is not None and f[1].pattern == sync._URLLIB3_SSL_WARNING
+        ]
 
-            result = runner.invoke(cli, ["sync", "--dry-run"], env=env)
+    # pytest resets warning filters per test, so make sure ours is installed first
+    importlib.reload(sync)
+    before = matching_filters()
+    assert len(before) == 1
 
-            # Verify command fails due to missing credentials
-            assert result.exit_code != 0
+    with patch("warnings.filterwarnings") as mock_filterwarnings:
+        importlib.reload(sync)
 
+    mock_filterwarnings.assert_not_called()
+    assert matching_filters() == before
 
-def test_logging_setup_called():
-    """Test that logging setup is called and CLI starts correctly"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--help"])
 
-    assert result.exit_code == 0
+def test_reimport_does_not_reload_dotenv():
+    """Re-importing sync must not parse .env again"""
+    import importlib
 
+    import sync
 
-def test_cli_log_level_option():
-    """Test CLI log level option"""
-    runner = CliRunner()
-    result = runner.invoke(cli, ["--log-level", "DEBUG", "--help"])
+    # The reload re-runs `from dotenv import load_dotenv`, which would replace a
+    # patch on sync.load_dotenv before the guard runs, so patch it at the source
+    try:
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            importlib.reload(sync)
 
-    assert result.exit_code == 0
+        mock_load_dotenv.assert_not_called()
+        assert sync._dotenv_loaded is True
+    finally:
+        # Rebind sync.load_dotenv to the real function for later tests
+        importlib.reload(sync)
+
+    assert sync.load_dotenv is not mock_load_dotenv
 
 
 class TestEnvTemplate:
@@ -375,24 +272,14 @@ class TestEnvTemplate:
 
     def test_env_template_contains_required_keys(self):
         """ENV_TEMPLATE must include all required credential keys."""
-        required = [
-            "BLUESKY_HANDLE",
-            "BLUESKY_PASSWORD",
-            "MASTODON_API_BASE_URL",
-            "MASTODON_ACCESS_TOKEN",
-        ]
-        for key in required:
-            assert key in ENV_TEMPLATE, f"{key} missing from ENV_TEMPLATE"
+        _assert_contains_all(ENV_TEMPLATE, _CREDENTIAL_KEYS)
 
     def test_env_template_contains_common_settings(self):
         """ENV_TEMPLATE should include common optional settings."""
-        for key in (
-            "SYNC_INTERVAL_MINUTES",
-            "MAX_POSTS_PER_SYNC",
-            "DRY_RUN",
-            "LOG_LEVEL",
-        ):
-            assert key in ENV_TEMPLATE, f"{key} missing from ENV_TEMPLATE"
+        _assert_contains_all(
+            ENV_TEMPLATE,
+            ["SYNC_INTERVAL_MINUTES", "MAX_POSTS_PER_SYNC", "DRY_RUN", "LOG_LEVEL"],
+        )
 
     def test_env_template_is_non_empty_string(self):
         assert isinstance(ENV_TEMPLATE, str) and len(ENV_TEMPLATE) > 0
@@ -419,63 +306,81 @@ class TestCliName:
 class TestSetupCommand:
     """Tests for the `setup` CLI command in standalone / no-repo mode."""
 
-    def test_setup_creates_env_file(self):
+    @pytest.fixture(autouse=True)
+    def _in_tmp_path(self, tmp_path, monkeypatch):
+        """Run each test from an empty directory so setup writes .env there."""
+        monkeypatch.chdir(tmp_path)
+
+    def test_setup_creates_env_file(self, cli_runner):
         """setup writes a .env file from the embedded template."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["setup"], input="n\n")
-            assert result.exit_code == 0, result.output
-            assert Path(".env").exists()
+        result = cli_runner.invoke(cli, ["setup"], input="n\n")
+        assert result.exit_code == 0, result.output
+        assert Path(".env").exists()
 
-    def test_setup_env_file_contains_required_keys(self):
+    def test_setup_env_file_contains_required_keys(self, cli_runner):
         """The .env file written by setup must contain required credential keys."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            runner.invoke(cli, ["setup"], input="n\n")
-            content = Path(".env").read_text()
-            for key in (
-                "BLUESKY_HANDLE",
-                "BLUESKY_PASSWORD",
-                "MASTODON_ACCESS_TOKEN",
-                "MASTODON_API_BASE_URL",
-            ):
-                assert key in content
-
-    def test_setup_does_not_require_env_example(self):
+        cli_runner.invoke(cli, ["setup"], input="n\n")
+        _assert_contains_all(Path(".env").read_text(), _CREDENTIAL_KEYS)
+
+    def test_setup_does_not_require_env_example(self, cli_runner):
         """setup must succeed even when .env.example is absent (standalone mode)."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            assert not Path(".env.example").exists()
-            result = runner.invoke(cli, ["setup"], input="n\n")
-            assert result.exit_code == 0
-            assert "Error" not in result.output
-
-    def test_setup_prompts_before_overwrite(self):
+        assert not Path(".env.example").exists()
+        result = cli_runner.invoke(cli, ["setup"], input="n\n")
+        assert result.exit_code == 0
+        assert "Error" not in result.output
+
+    def test_setup_prompts_before_overwrite(self, cli_runner):
         """setup asks for confirmation when .env already exists."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path(".env").write_text("EXISTING=1\n")
-            result = runner.invoke(cli, ["setup"], input="n\n")  # decline overwrite
-            assert result.exit_code == 0
-            assert "already exists" in result.output
-            # Original file must be untouched
-            assert Path(".env").read_text() == "EXISTING=1\n"
-
-    def test_setup_overwrites_on_confirm(self):
+        Path(".env").write_text("EXISTING=1\n")
+        result = cli_runner.invoke(cli, ["setup"], input="n\n")  # decline overwrite
+        assert result.exit_code == 0
+        assert "already exists" in result.output
+        # Original file must be untouched
+        assert Path(".env").read_text() == "EXISTING=1\n"
+
+    def test_setup_overwrites_on_confirm(self, cli_runner):
         """setup replaces .env when the user confirms."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            Path(".env").write_text("EXISTING=1\n")
-            result = runner.invoke(
-                cli, ["setup"], input="y\nn\n"
-            )  # confirm overwrite, skip editor
-            assert result.exit_code == 0
-            content = Path(".env").read_text()
-            assert "BLUESKY_HANDLE" in content
-
-    def test_setup_shows_github_url(self):
+        Path(".env").write_text("EXISTING=1\n")
+        result = cli_runner.invoke(
+            cli, ["setup"], input="y\nn\n"
+        )  # confirm overwrite, skip editor
+        assert result.exit_code == 0
+        content = Path(".env").read_text()
+        assert "BLUESKY_HANDLE" in content
+
+    def test_setup_shows_github_url(self, cli_runner):
         """Hint shown after setup must point to the GitHub docs URL."""
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["setup"], input="n\n")
-            assert "github.com/hossain-khan/social-sync" in result.output
+        result = cli_runner.invoke(cli, ["setup"], input="n\n")
+        assert "github.com/hossain-khan/social-sync" in result.output
+
+    def test_setup_execs_safe_editor(self, cli_runner):
+        """Opening .env replaces the process with a whitelisted editor."""
+        with patch("sync.os.execvp") as mock_execvp:
+            result = cli_runner.invoke(
+                cli, ["setup"], input="y\n", env={"EDITOR": "vim"}
+            )
+        assert result.exit_code == 0, result.output
+        mock_execvp.assert_called_once_with("vim", ["vim", ".env"])
+
+    def test_setup_runs_editor_as_child_on_windows(self, cli_runner):
+        """On Windows the editor runs as a child process rather than via exec."""
+        with (
+            patch("sync.sys.platform", "win32"),
+            patch("sync.subprocess.run") as mock_run,
+            patch("sync.os.execvp") as mock_execvp,
+        ):
+            result = cli_runner.invoke(
+                cli, ["setup"], input="y\n", env={"EDITOR": "notepad"}
+            )
+        assert result.exit_code == 0, result.output
+        mock_run.assert_called_once_with(["notepad", ".env"], check=True)
+        mock_execvp.assert_not_called()
+
+    def test_setup_reports_missing_editor(self, cli_runner):
+        """A missing editor binary falls back to a manual-edit hint."""
+        with patch("sync.os.execvp", side_effect=FileNotFoundError):
+            result = cli_runner.invoke(
+                cli, ["setup"], input="y\n", env={"EDITOR": "nano"}
+            )
+        assert result.exit_code == 0
+        assert "Editor 'nano' not found" in result.output
@@ -2,41 +2,73 @@
 Tests for Configuration Management
 """
 
-import os
-import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from pydantic import ValidationError
 
 from src.config import Settings
 
-
+# Boolean string representations and the value each should parse to
+_BOOLEAN_CASES = [
+    ("true", True),
+    ("True", True),
+    ("TRUE", True),
+    ("1", True),
+    ("false", False),
+    ("False", False),
+    ("FALSE", False),
+    ("0", False),
+]
+
+# Valid SYNC_START_DATE formats from .env.example, with the datetime each yields.
+# Date-only and offset values are timezone-aware and compare equal across offsets,
+# so expectations are written in UTC; naive values never equal aware ones.
+_VALID_SYNC_START_DATES = [
+    # Date only format: SYNC_START_DATE=2025-01-01
+    ("2025-01-01", datetime(2025, 1, 1, tzinfo=timezone.utc)),
+    ("2025-12-31", datetime(2025, 12, 31, tzinfo=timezone.utc)),
+    # Datetime format without timezone: SYNC_START_DATE=2025-01-15T10:30:00
+    ("2025-01-15T10:30:00", datetime(2025, 1, 15, 10, 30, 0)),
+    ("2025-06-20T23:59:59", datetime(2025, 6, 20, 23, 59, 59)),
+    # Datetime with timezone: SYNC_START_DATE=2025-01-15T10:30:00-05:00
+    ("2025-01-15T10:30:00-05:00", datetime(2025, 1, 15, 15, 30, tzinfo=timezone.utc)),
+    ("2025-01-15T10:30:00+02:00", datetime(2025, 1, 15, 8, 30, tzinfo=timezone.utc)),
+    # Z format (UTC)
+    ("2025-01-15T10:30:00Z", datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)),
+]
+
+_INVALID_SYNC_START_DATES = [
+    "2025-13-01",  # Invalid month
+    "2025-01-32",  # Invalid day
+    "2025/01/01",  # Wrong separator
+    "01-01-2025",  # Wrong order
+    "2025-1-1",  # Missing zero padding
+    "2025-01-01 10:30",  # Space separator instead of T
+    "not-a-date",  # Non-date string
+    "2025-01-01T25:00:00",  # Invalid hour
+    "2025-01-01T10:60:00",  # Invalid minute
+    "2025-01-01T10:30:60",  # Invalid second
+    "",  # Empty string
+    "2025",  # Year only
+    "01-01",  # Month-day only
+]
+
+
+@pytest.mark.usefixtures("clean_settings_env")
 class TestSettings:
     """Test the Settings configuration class"""
 
-    def setup_method(self):
-        """Clean up environment before each test"""
-        # Store original environment
-        self.original_env = os.environ.copy()
-
-        # Clear all social sync related env vars
-        for key in list(os.environ.keys()):
-            if key.upper().startswith(
-                ("BLUESKY_", "MASTODON_", "SYNC_", "MAX_POSTS", "DRY_RUN", "LOG_LEVEL")
-            ):
-                del os.environ[key]
-
-    def teardown_method(self):
-        """Restore environment after each test"""
-        os.environ.clear()
-        os.environ.update(self.original_env)
+    @pytest.fixture(autouse=True)
+    def _no_env_file(self, monkeypatch):
+        """Read settings from the environment alone, never from a developer's .env"""
+        monkeypatch.setitem(Settings.model_config, "env_file", None)
 
-    def test_settings_with_valid_config(self):
+    def test_settings_with_valid_config(self, monkeypatch):
         """Test Settings initialization with valid configuration"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
+        monkeypatch.setenv("BLUESKY_HANDLE", "test.bsky.social")
+        monkeypatch.setenv("BLUESKY_PASSWORD", "test-password")
+        monkeypatch.setenv("MASTODON_ACCESS_TOKEN", "test-token")
 
         settings = Settings()
 
@@ -44,29 +76,9 @@ class TestSettings:
         assert settings.bluesky_password == "test-password"
         assert settings.mastodon_access_token == "test-token"
 
-    def test_settings_defaults(self):
+    def test_settings_defaults(self, settings_credentials):
         """Test Settings with code defaults (no environment variables)"""
-        # Set only required fields and ensure others are not set
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        # Explicitly clear environment variables that might override defaults
-        env_vars_to_clear = [
-            "DRY_RUN",
-            "SYNC_INTERVAL_MINUTES",
-            "MAX_POSTS_PER_SYNC",
-            "LOG_LEVEL",
-            "STATE_FILE",
-            "MASTODON_API_BASE_URL",
-            "SYNC_START_DATE",
-        ]
-        for var in env_vars_to_clear:
-            if var in os.environ:
-                del os.environ[var]
-
-        # Create settings with _env_file=None to prevent .env file loading
-        settings = Settings(_env_file=None)
+        settings = Settings()
 
         # Test code defaults (not .env file values)
         assert settings.sync_interval_minutes == 60
@@ -79,17 +91,17 @@ class TestSettings:
         )  # Code default
         assert settings.sync_start_date is None  # Code default
 
-    def test_settings_custom_values(self):
+    def test_settings_custom_values(self, monkeypatch):
         """Test Settings with custom environment values"""
-        os.environ["BLUESKY_HANDLE"] = "custom.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "custom-password"
-        os.environ["MASTODON_API_BASE_URL"] = "https://custom.social"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "custom-token"
-        os.environ["SYNC_INTERVAL_MINUTES"] = "30"
-        os.environ["MAX_POSTS_PER_SYNC"] = "50"
-        os.environ["DRY_RUN"] = "true"
-        os.environ["LOG_LEVEL"] = "DEBUG"
-        os.environ["STATE_FILE"] = "custom_state.json"
+        monkeypatch.setenv("BLUESKY_HANDLE", "custom.bsky.social")
+        monkeypatch.setenv("BLUESKY_PASSWORD", "custom-password")
+        monkeypatch.setenv("MASTODON_API_BASE_URL", "https://custom.social")
+        monkeypatch.setenv("MASTODON_ACCESS_TOKEN", "custom-token")
+        monkeypatch.setenv("SYNC_INTERVAL_MINUTES", "30")
+        monkeypatch.setenv("MAX_POSTS_PER_SYNC", "50")
+        monkeypatch.setenv("DRY_RUN", "true")
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        monkeypatch.setenv("STATE_FILE", "custom_state.json")
 
         settings = Settings()
 
@@ -103,11 +115,11 @@ class TestSettings:
         assert settings.log_level == "DEBUG"
         assert settings.state_file == "custom_state.json"
 
-    def test_case_insensitive_env_vars(self):
+    def test_case_insensitive_env_vars(self, monkeypatch):
         """Test that environment variables are case insensitive"""
-        os.environ["bluesky_handle"] = "test.bsky.social"  # lowercase
-        os.environ["BLUESKY_PASSWORD"] = "test-password"  # uppercase
-        os.environ["Mastodon_Access_Token"] = "test-token"  # mixed case
+        monkeypatch.setenv("bluesky_handle", "test.bsky.social")  # lowercase
+        monkeypatch.setenv("BLUESKY_PASSWORD", "test-password")  # uppercase
+        monkeypatch.setenv("Mastodon_Access_Token", "test-token")  # mixed case
 
         settings = Settings()
 
@@ -115,167 +127,73 @@ class TestSettings:
         assert settings.bluesky_password == "test-password"
         assert settings.mastodon_access_token == "test-token"
 
-    def test_boolean_env_var_parsing(self):
+    @pytest.mark.parametrize("env_value,expected", _BOOLEAN_CASES)
+    def test_boolean_env_var_parsing(
+        self, settings_credentials, monkeypatch, env_value, expected
+    ):
         """Test that boolean environment variables are parsed correctly"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
+        monkeypatch.setenv("DRY_RUN", env_value)
 
-        # Test various boolean string representations
-        test_cases = [
-            ("true", True),
-            ("True", True),
-            ("TRUE", True),
-            ("1", True),
-            ("false", False),
-            ("False", False),
-            ("FALSE", False),
-            ("0", False),
-        ]
+        settings = Settings()
 
-        for env_value, expected in test_cases:
-            os.environ["DRY_RUN"] = env_value
-            settings = Settings()
-            assert (
-                settings.dry_run == expected
-            ), f"Failed for {env_value}: expected {expected}, got {settings.dry_run}"
+        assert settings.dry_run is expected
 
-    def test_integer_env_var_parsing(self):
+    @pytest.mark.parametrize("env_value,expected", [("15", 15), ("30", 30), ("60", 60)])
+    def test_integer_env_var_parsing(
+        self, settings_credentials, monkeypatch, env_value, expected
+    ):
         """Test that integer environment variables are parsed correctly"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
+        monkeypatch.setenv("SYNC_INTERVAL_MINUTES", env_value)
 
-        test_cases = [
-            ("15", 15),
-            ("30", 30),
-            ("60", 60),
-        ]
+        settings = Settings()
 
-        for env_value, expected in test_cases:
-            os.environ["SYNC_INTERVAL_MINUTES"] = env_value
-            settings = Settings()
-            assert settings.sync_interval_minutes == expected
+        assert settings.sync_interval_minutes == expected
 
-    def test_sync_start_date_format_validation(self):
+    @pytest.mark.parametrize("date_str,expected_datetime", _VALID_SYNC_START_DATES)
+    def test_sync_start_date_format_validation(
+        self, settings_credentials, monkeypatch, date_str, expected_datetime
+    ):
         """Test that SYNC_START_DATE formats from .env.example are properly validated"""
-        # Set required credentials for Settings initialization
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        # Test valid date formats from .env.example
-        valid_formats = [
-            # Date only format: SYNC_START_DATE=2025-01-01
-            ("2025-01-01", datetime(2025, 1, 1, 0, 0, 0)),
-            ("2025-12-31", datetime(2025, 12, 31, 0, 0, 0)),
-            # Datetime format without timezone: SYNC_START_DATE=2025-01-15T10:30:00
-            ("2025-01-15T10:30:00", datetime(2025, 1, 15, 10, 30, 0)),
-            ("2025-06-20T23:59:59", datetime(2025, 6, 20, 23, 59, 59)),
-            # Datetime with timezone: SYNC_START_DATE=2025-01-15T10:30:00-05:00
-            (
-                "2025-01-15T10:30:00-05:00",
-                datetime(2025, 1, 15, 15, 30, 0),
-            ),  # UTC conversion
-            (
-                "2025-01-15T10:30:00+02:00",
-                datetime(2025, 1, 15, 8, 30, 0),
-            ),  # UTC conversion
-            (
-                "2025-01-15T10:30:00Z",
-                datetime(2025, 1, 15, 10, 30, 0),
-            ),  # Z format (UTC)
-        ]
+        monkeypatch.setenv("SYNC_START_DATE", date_str)
 
-        for date_str, expected_datetime in valid_formats:
-            os.environ["SYNC_START_DATE"] = date_str
-            settings = Settings(_env_file=None)  # Prevent .env file loading
-
-            # Test that validation passes
-            assert (
-                settings.sync_start_date == date_str
-            ), f"Failed to store date string: {date_str}"
-
-            # Test that datetime conversion works correctly
-            result_datetime = settings.get_sync_start_datetime()
-            assert isinstance(
-                result_datetime, datetime
-            ), f"Expected datetime object for: {date_str}"
-
-            # Convert to UTC naive datetime for comparison
-            if result_datetime.tzinfo is not None:
-                result_datetime = result_datetime.astimezone(timezone.utc).replace(
-                    tzinfo=None
-                )
-
-            assert result_datetime == expected_datetime, (
-                f"Date conversion failed for {date_str}: "
-                f"expected {expected_datetime}, got {result_datetime}"
-            )
-
-    def test_sync_start_date_invalid_formats(self):
-        """Test that invalid SYNC_START_DATE formats are properly rejected"""
-        # Set required credentials for Settings initialization
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        # Test invalid date formats
-        invalid_formats = [
-            "2025-13-01",  # Invalid month
-            "2025-01-32",  # Invalid day
-            "2025/01/01",  # Wrong separator
-            "01-01-2025",  # Wrong order
-            "2025-1-1",  # Missing zero padding
-            "2025-01-01 10:30",  # Space separator instead of T
-            "not-a-date",  # Non-date string
-            "2025-01-01T25:00:00",  # Invalid hour
-            "2025-01-01T10:60:00",  # Invalid minute
-            "2025-01-01T10:30:60",  # Invalid second
-            "",  # Empty string
-            "2025",  # Year only
-            "01-01",  # Month-day only
-        ]
+        settings = Settings()
 
-        for invalid_date in invalid_formats:
-            os.environ["SYNC_START_DATE"] = invalid_date
+        # Test that validation passes
+        assert settings.sync_start_date == date_str
 
-            with pytest.raises(ValidationError) as exc_info:
-                Settings(_env_file=None)  # Prevent .env file loading
+        # Test that datetime conversion works correctly
+        result_datetime = settings.get_sync_start_datetime()
+        assert result_datetime == expected_datetime
 
-            # Verify the error message mentions the expected format
-            error_message = str(exc_info.value)
-            assert "sync_start_date must be in ISO format" in error_message, (
-                f"Expected ISO format error message for invalid date: {invalid_date}, "
-                f"but got: {error_message}"
-            )
+    @pytest.mark.parametrize("invalid_date", _INVALID_SYNC_START_DATES)
+    def test_sync_start_date_invalid_formats(
+        self, settings_credentials, monkeypatch, invalid_date
+    ):
+        """Test that invalid SYNC_START_DATE formats are properly rejected"""
+        monkeypatch.setenv("SYNC_START_DATE", invalid_date)
+
+        # The error message must mention the expected format
+        with pytest.raises(
+            ValidationError, match="sync_start_date must be in ISO format"
+        ):
+            Settings()
 
-    def test_sync_start_date_edge_cases(self):
+    def test_sync_start_date_edge_cases(self, settings_credentials, monkeypatch):
         """Test edge cases for SYNC_START_DATE handling"""
-        # Set required credentials for Settings initialization
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        # Test None/unset case - prevent .env file loading
-        if "SYNC_START_DATE" in os.environ:
-            del os.environ["SYNC_START_DATE"]
-        settings = Settings(_env_file=None)  # Prevent .env file loading
+        # Test None/unset case
+        monkeypatch.delenv("SYNC_START_DATE", raising=False)
+        settings = Settings()
         assert settings.sync_start_date is None
 
         # get_sync_start_datetime() should return 7 days ago when None
+        before = datetime.now(timezone.utc) - timedelta(days=7)
         result = settings.get_sync_start_datetime()
-        assert isinstance(result, datetime)
-        # Verify it's approximately 7 days ago (within a few minutes tolerance)
-        expected_timestamp = time.time() - (7 * 24 * 60 * 60)  # 7 days ago
-        actual_timestamp = result.timestamp()
-        assert (
-            abs(actual_timestamp - expected_timestamp) < 300
-        ), f"Expected approximately 7 days ago, got {result}"  # 5 minutes tolerance
+        after = datetime.now(timezone.utc) - timedelta(days=7)
+        assert before <= result <= after
 
         # Test leap year date
-        os.environ["SYNC_START_DATE"] = "2024-02-29"  # Valid leap year date
-        settings = Settings(_env_file=None)
+        monkeypatch.setenv("SYNC_START_DATE", "2024-02-29")  # Valid leap year date
+        settings = Settings()
         result = settings.get_sync_start_datetime()
         assert result.year == 2024
         assert result.month == 2
@@ -288,48 +206,56 @@ class TestSettings:
         ]
 
         for date_str, expected in test_cases:
-            os.environ["SYNC_START_DATE"] = date_str
-            settings = Settings(_env_file=None)
+            monkeypatch.setenv("SYNC_START_DATE", date_str)
+            settings = Settings()
             result = settings.get_sync_start_datetime()
-            # Convert to UTC naive datetime for comparison if timezone-aware
-            if result.tzinfo is not None:
-                result = result.astimezone(timezone.utc).replace(tzinfo=None)
             assert result == expected, f"Edge case failed for {date_str}"
 
-    def test_image_upload_failure_strategy_validation(self):
-        """Test validation of image_upload_failure_strategy"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        # Valid strategies should work
-        valid_strategies = ["skip_post", "partial", "text_placeholder"]
-        for strategy in valid_strategies:
-            os.environ["IMAGE_UPLOAD_FAILURE_STRATEGY"] = strategy
-            settings = Settings(_env_file=None)
-            assert settings.image_upload_failure_strategy == strategy
-
-        # Invalid strategy should raise error
-        os.environ["IMAGE_UPLOAD_FAILURE_STRATEGY"] = "invalid_strategy"
+    def test_sync_start_datetime_parsed_once(self, settings_credentials, monkeypatch):
+        """Test that the configured start date is parsed once and reused"""
+        monkeypatch.setenv("SYNC_START_DATE", "2025-01-15T10:30:00Z")
+        settings = Settings()
+
+        first = settings.get_sync_start_datetime()
+        assert settings.get_sync_start_datetime() is first
+
+        # Changing the date afterwards must not return the stale value
+        settings.sync_start_date = "2024-02-29"
+        assert settings.get_sync_start_datetime() == datetime(
+            2024, 2, 29, tzinfo=timezone.utc
+        )
+
+    @pytest.mark.parametrize("strategy", ["skip_post", "partial", "text_placeholder"])
+    def test_image_upload_failure_strategy_valid(
+        self, settings_credentials, monkeypatch, strategy
+    ):
+        """Test that each supported image_upload_failure_strategy is accepted"""
+        monkeypatch.setenv("IMAGE_UPLOAD_FAILURE_STRATEGY", strategy)
+
+        settings = Settings()
+        assert settings.image_upload_failure_strategy == strategy
+
+    def test_image_upload_failure_strategy_invalid(
+        self, settings_credentials, monkeypatch
+    ):
+        """Test that an unknown image_upload_failure_strategy is rejected"""
+        monkeypatch.setenv("IMAGE_UPLOAD_FAILURE_STRATEGY", "invalid_strategy")
+
         with pytest.raises(ValidationError) as exc_info:
-            Settings(_env_file=None)
-        assert "image_upload_failure_strategy" in str(exc_info.value)
+            Settings()
+        errors = exc_info.value.errors(include_url=False, include_context=False)
+        assert [error["loc"] for error in errors] == [
+            ("image_upload_failure_strategy",)
+        ]
 
-    def test_image_upload_max_retries_default(self):
+    def test_image_upload_max_retries_default(self, settings_credentials):
         """Test default value for image_upload_max_retries"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-
-        settings = Settings(_env_file=None)
+        settings = Settings()
         assert settings.image_upload_max_retries == 3
 
-    def test_image_upload_max_retries_custom(self):
+    def test_image_upload_max_retries_custom(self, settings_credentials, monkeypatch):
         """Test custom value for image_upload_max_retries"""
-        os.environ["BLUESKY_HANDLE"] = "test.bsky.social"
-        os.environ["BLUESKY_PASSWORD"] = "test-password"
-        os.environ["MASTODON_ACCESS_TOKEN"] = "test-token"
-        os.environ["IMAGE_UPLOAD_MAX_RETRIES"] = "5"
+        monkeypatch.setenv("IMAGE_UPLOAD_MAX_RETRIES", "5")
 
-        settings = Settings(_env_file=None)
+        settings = Settings()
         assert settings.image_upload_max_retries == 5
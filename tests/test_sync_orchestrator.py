@@ -2,16 +2,9 @@
 Tests for Sync Orchestrator
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add the parent directory to sys.path to import src as a package
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from src.bluesky_client import BlueskyFetchResult, BlueskyPost
 from src.sync_orchestrator import SocialSyncOrchestrator
 
@@ -1084,7 +1077,7 @@ class TestSocialSyncOrchestrator:
         self.mock_content_processor.has_no_sync_tag.return_value = False
 
         # Mock mixed success/failure
-        def sync_post_side_effect(post):
+        def sync_post_side_effect(post, prepared_media=None):
             return post.uri == "at://success-post"
 
         with patch.object(
@@ -1098,6 +1091,200 @@ class TestSocialSyncOrchestrator:
         assert result["skipped_count"] == 0
         assert result["total_processed"] == 2
 
+    def test_run_sync_prefetches_media_for_posts_with_embeds(self):
+        """Test run_sync uploads the next post's media ahead of time"""
+        self.mock_bluesky_client.authenticate.return_value = True
+        self.mock_mastodon_client.authenticate.return_value = True
+
+        image_embed = {"py_type": "app.bsky.embed.images", "images": [{}]}
+        mock_posts = [
+            BlueskyPost(
+                uri="at://post-text-only",
+                cid="cid-1",
+                text="Text only",
+                created_at=datetime(2025, 1, 1, 10, 0),
+                author_handle="test.bsky.social",
+                author_display_name="Test User",
+            ),
+            BlueskyPost(
+                uri="at://post-with-image",
+                cid="cid-2",
+                text="Post with image",
+                created_at=datetime(2025, 1, 1, 11, 0),
+                author_handle="test.bsky.social",
+                author_display_name="Test User",
+                embed=image_embed,
+            ),
+        ]
+        self.mock_bluesky_client.get_recent_posts.return_value = BlueskyFetchResult(
+            posts=mock_posts,
+            total_retrieved=2,
+            filtered_replies=0,
+            filtered_reposts=0,
+            filtered_by_date=0,
+        )
+        self.mock_sync_state.is_post_synced.return_value = False
+        self.mock_sync_state.is_post_skipped.return_value = False
+        self.mock_content_processor.has_no_sync_tag.return_value = False
+
+        with (
+            patch.object(
+                self.orchestrator,
+                "_upload_media",
+                return_value=(["media-1"], True, 1),
+            ) as mock_upload_media,
+            patch.object(
+                self.orchestrator, "sync_post", return_value=True
+            ) as mock_sync_post,
+            patch("src.sync_orchestrator.time.sleep"),
+        ):
+            result = self.orchestrator.run_sync()
+
+        assert result["synced_count"] == 2
+        mock_upload_media.assert_called_once_with(mock_posts[1])
+        assert mock_sync_post.call_args_list[0].kwargs["prepared_media"] is None
+        assert mock_sync_post.call_args_list[1].kwargs["prepared_media"] == (
+            ["media-1"],
+            True,
+            1,
+        )
+
+    def test_run_sync_does_not_prefetch_after_failed_post(self):
+        """Test no media is uploaded ahead of time once the current post fails"""
+        self.mock_bluesky_client.authenticate.return_value = True
+        self.mock_mastodon_client.authenticate.return_value = True
+
+        image_embed = {"py_type": "app.bsky.embed.images", "images": [{}]}
+        mock_posts = [
+            BlueskyPost(
+                uri=f"at://post-{index}",
+                cid=f"cid-{index}",
+                text="Post with image",
+                created_at=datetime(2025, 1, 1, 10 + index, 0),
+                author_handle="test.bsky.social",
+                author_display_name="Test User",
+                embed=image_embed,
+            )
+            for index in range(2)
+        ]
+        self.mock_bluesky_client.get_recent_posts.return_value = BlueskyFetchResult(
+            posts=mock_posts,
+            total_retrieved=2,
+            filtered_replies=0,
+            filtered_reposts=0,
+            filtered_by_date=0,
+        )
+        self.mock_sync_state.is_post_synced.return_value = False
+        self.mock_sync_state.is_post_skipped.return_value = False
+        self.mock_content_processor.has_no_sync_tag.return_value = False
+
+        with (
+            patch.object(self.orchestrator, "_upload_media") as mock_upload_media,
+            patch.object(
+                self.orchestrator, "sync_post", return_value=False
+            ) as mock_sync_post,
+        ):
+            result = self.orchestrator.run_sync()
+
+        assert result["failed_count"] == 2
+        mock_upload_media.assert_not_called()
+        for sync_call in mock_sync_post.call_args_list:
+            assert sync_call.kwargs["prepared_media"] is None
+
+    def test_run_sync_fails_post_after_prefetch_failure(self):
+        """Test a failed background upload fails the post without re-uploading"""
+        self.mock_bluesky_client.authenticate.return_value = True
+        self.mock_mastodon_client.authenticate.return_value = True
+
+        # The first post is synced, so the second one's media is prefetched
+        text_post = BlueskyPost(
+            uri="at://post-text-only",
+            cid="cid-1",
+            text="Text only",
+            created_at=datetime(2025, 1, 1, 10, 0),
+            author_handle="test.bsky.social",
+            author_display_name="Test User",
+        )
+        mock_post = BlueskyPost(
+            uri="at://post-with-image",
+            cid="cid-2",
+            text="Post with image",
+            created_at=datetime(2025, 1, 1, 11, 0),
+            author_handle="test.bsky.social",
+            author_display_name="Test User",
+            embed={"py_type": "app.bsky.embed.images", "images": [{}]},
+        )
+        self.mock_bluesky_client.get_recent_posts.return_value = BlueskyFetchResult(
+            posts=[text_post, mock_post],
+            total_retrieved=2,
+            filtered_replies=0,
+            filtered_reposts=0,
+            filtered_by_date=0,
+        )
+        self.mock_sync_state.is_post_synced.return_value = False
+        self.mock_sync_state.is_post_skipped.return_value = False
+        self.mock_content_processor.has_no_sync_tag.return_value = False
+        self.mock_content_processor.process_bluesky_to_mastodon.return_value = "Text"
+        self.mock_content_processor.add_sync_attribution.return_value = "Text"
+        self.mock_mastodon_client.post_status.return_value = {"id": "mastodon-1"}
+
+        def upload_then_fail(bluesky_post):
+            # The media reaches Mastodon before the worker fails
+            self.orchestrator.mastodon_client.upload_media(
+                media_file=b"image", mime_type="image/jpeg", description=""
+            )
+            raise RuntimeError("connection reset")
+
+        with (
+            patch.object(
+                self.orchestrator, "_upload_media", side_effect=upload_then_fail
+            ) as mock_upload_media,
+            patch("src.sync_orchestrator.time.sleep"),
+        ):
+            result = self.orchestrator.run_sync()
+
+        assert result["synced_count"] == 1
+        assert result["failed_count"] == 1
+        mock_upload_media.assert_called_once_with(mock_post)
+        self.mock_mastodon_client.upload_media.assert_called_once()
+        # Only the text post goes out; the other is left for the next run
+        self.mock_mastodon_client.post_status.assert_called_once()
+        self.mock_sync_state.mark_post_synced.assert_called_once_with(
+            text_post.uri, "mastodon-1"
+        )
+
+    def test_sync_post_uses_prepared_media(self):
+        """Test sync_post attaches prepared media without uploading again"""
+        self.mock_bluesky_client.authenticate.return_value = True
+        self.mock_mastodon_client.authenticate.return_value = True
+        self.orchestrator.setup_clients()
+
+        mock_post = BlueskyPost(
+            uri="at://post-with-image",
+            cid="cid-1",
+            text="Post with image",
+            created_at=datetime(2025, 1, 1, 10, 0),
+            author_handle="test.bsky.social",
+            author_display_name="Test User",
+            embed={"py_type": "app.bsky.embed.images", "images": [{}]},
+        )
+        self.mock_content_processor.extract_images_from_embed.return_value = [{}]
+        self.mock_content_processor.extract_video_from_embed.return_value = None
+        self.mock_content_processor.process_bluesky_to_mastodon.return_value = "Text"
+        self.mock_content_processor.add_sync_attribution.return_value = "Text"
+        self.mock_mastodon_client.post_status.return_value = {"id": "mastodon-1"}
+
+        with patch.object(self.orchestrator, "_sync_images") as mock_sync_images:
+            result = self.orchestrator.sync_post(
+                mock_post, prepared_media=(["media-1"], True, 1)
+            )
+
+        assert result is True
+        mock_sync_images.assert_not_called()
+        assert self.mock_mastodon_client.post_status.call_args[1]["media_ids"] == [
+            "media-1"
+        ]
+
     def test_run_sync_with_skipped_posts(self):
         """Test sync run with posts being skipped due to #no-sync tag"""
         # Mock client setup
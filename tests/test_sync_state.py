@@ -330,6 +330,20 @@ class TestSyncState:
                 # Restore write permissions for cleanup
                 os.chmod(readonly_dir, stat.S_IRWXU)
 
+    def test_save_state_encoding_error_keeps_previous_file(self):
+        """Test a state that fails to encode does not truncate the saved file"""
+        self.sync_state.mark_post_synced("at://saved-post", "mastodon-1")
+        with open(self.state_file_path) as f:
+            saved_contents = f.read()
+
+        circular: dict = {}
+        circular["self"] = circular
+        self.sync_state.state["broken"] = circular
+        self.sync_state._save_state()
+
+        with open(self.state_file_path) as f:
+            assert f.read() == saved_contents
+
     def test_malformed_datetime_in_state(self):
         """Test recovery from malformed datetime in state file"""
         # Write JSON with invalid datetime format
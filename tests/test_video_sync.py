@@ -2,15 +2,8 @@
 Tests for video sync functionality
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import Mock, patch
 
-# Add the parent directory to sys.path to import src as a package
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from src.bluesky_client import BlueskyClient
 from src.content_processor import ContentProcessor
 from src.mastodon_client import MastodonClient